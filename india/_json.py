@@ -0,0 +1,40 @@
+"""
+JSON encoding shared by the CLI command groups and the data modules.
+
+orjson is used when installed, with the standard library as the fallback.
+"""
+
+import json
+from typing import Any, Mapping
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    return str(obj)
+
+
+def dumps(data: Any) -> str:
+    """Pretty-print data as JSON for terminal output."""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            data, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(data, indent=2, default=_json_default, ensure_ascii=False)
+
+
+def dumps_compact(data: Any) -> bytes:
+    """Encode data as compact UTF-8 JSON for payloads and caches."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=_json_default)
+    return json.dumps(
+        data, default=_json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
@@ -0,0 +1,326 @@
+"""
+Amul counter-narrative content.
+
+Hindi/English bodies, citations, and metadata for each narrative. Imported
+lazily by narrative_generator the first time a narrative is built, so
+importing the generator does not pay for compressing this text.
+"""
+
+import zlib
+from string import Template
+
+# Figures quoted across narratives; keep in step with AMUL_PROFILE when the
+# annual report is refreshed
+FACTS = {
+    "revenue_crore": "72,000",
+    "plants": "90+",
+    "daily_litres_en": "26 million",
+    "daily_litres_hi": "2.6 करोड़",
+    "members_en": "3.6 million",
+    "members_hi": "36 लाख",
+    "water_per_litre": "1000+",
+    "world_bank_loans": "$150 million",
+}
+
+
+def _body(template: str) -> bytes:
+    """Fill in FACTS and compress; bodies are only decoded when first requested."""
+    text = Template(template).substitute(FACTS)
+    return zlib.compress(text.encode("utf-8"), 9)
+
+
+COOPERATIVE_BETRAYAL_HINDI = _body("""\
+*Amul: सहकारिता या industry?* 🐄
+
+Amul की शुरुआत 1946 में हुई — Kaira के किसानों ने बिचौलियों से आज़ादी के लिए। Dr. \
+Kurien ने इसे White Revolution बनाया।
+
+आज Amul:
+💰 Revenue: Rs ${revenue_crore} करोड़
+🏭 ${plants} processing plants
+📊 ${daily_litres_hi} लीटर दूध/दिन
+
+ये cooperative है या MNC?
+
+किसान को दूध का Rs 30-40/लीटर मिलता है।
+Amul उसे Rs 60-80 में बेचता है।
+Processing, packaging, marketing — सब में cooperative का margin।
+
+और जानवर? वो तो बस production unit हैं।
+बार-बार गर्भवती। AI से cross-breeding। नर बछड़े ग़ायब।
+दूध कम हुआ तो बाहर। कुदरती उम्र 20 साल — use 5-6 साल।
+
+*Amul की Taste of India एक illusion है।*
+*असली taste — exploitation का है।*
+""")
+
+
+COOPERATIVE_BETRAYAL_ENGLISH = _body("""\
+Amul: Cooperative or Corporation?
+
+Amul began in 1946 as a farmers' revolt against middlemen in Kaira, Gujarat. Dr. \
+Verghese Kurien turned it into the White Revolution.
+
+Today's Amul:
+- Revenue: Rs ${revenue_crore} crore (~$$8.6 billion)
+- ${plants} processing plants
+- ${daily_litres_en} litres/day collection
+- ${members_en} farmer members
+
+Is this a cooperative or a multinational?
+
+The farmer receives Rs 30-40/litre. Amul sells at Rs 60-80/litre. The gap funds an \
+industrial machine.
+
+And the animals? They're production units.
+Repeatedly impregnated. Crossbred for yield. Male calves disappeared. Discarded when \
+production drops. Natural lifespan 20 years; used for 5-6.
+
+Amul's 'Taste of India' is branding.
+The real taste is exploitation.""")
+
+
+MISSING_CALVES_HINDI = _body("""\
+*ग़ायब बछड़े: Amul का अनकहा सच* 🐄
+
+Amul system में ${members_hi} किसान हैं।
+हर गाय/भैंस को हर साल गर्भवती किया जाता है।
+50% बछड़े नर होते हैं।
+
+तो हर साल लाखों नर बछड़े कहाँ जाते हैं?
+
+📊 20th Livestock Census (2019): Gujarat में cattle का male:female ratio बहुत skewed है \
+— females ज़्यादा, males ग़ायब।
+
+नर बछड़ों का कोई economic value नहीं dairy system में:
+❌ दूध नहीं देते
+❌ Cross-breed हैं तो draught work नहीं कर सकते
+❌ Feed cost Rs 50-80/दिन — किसान afford नहीं कर सकता
+
+तो?
+
+→ छोड़ दिए जाते हैं सड़कों पर (stray cattle crisis)
+→ बेच दिए जाते हैं कसाई को
+→ भूख से मर जाते हैं
+
+Amul इस बारे में कभी बात नहीं करता।
+Amul Girl की तस्वीर में बछड़ा कभी नहीं दिखता।
+
+*RTI file करें: Rashtriya Gokul Mission से पूछें — Gujarat में नर बछड़ों का क्या होता \
+है?*
+""")
+
+
+MISSING_CALVES_ENGLISH = _body("""\
+The Missing Calves: Amul's Untold Truth
+
+The Amul system has ${members_en} farmer members.
+Every cow/buffalo is impregnated annually.
+50% of calves are male.
+
+Where do millions of male calves go every year?
+
+The 20th Livestock Census (2019) shows Gujarat's cattle sex ratio is heavily skewed — \
+far more females than males. The males vanish.
+
+Male calves have zero economic value in dairy:
+- Can't produce milk
+- Crossbreeds can't do draught work
+- Feed costs Rs 50-80/day — farmers can't afford it
+
+So they are:
+- Abandoned on roads (Gujarat's stray cattle crisis)
+- Sold to informal slaughter
+- Left to starve
+
+Amul never talks about this.
+The Amul Girl never appears next to a calf.
+
+File RTI: Ask Rashtriya Gokul Mission what happens to male calves in Gujarat.""")
+
+
+WATER_FOOTPRINT_HINDI = _body("""\
+*Amul और पानी: Gujarat का छुपा संकट* 💧
+
+Gujarat भारत के सबसे water-stressed राज्यों में से एक है।
+और Gujarat India का सबसे बड़ा दूध उत्पादक है।
+
+Connection? बिल्कुल।
+
+Amul ${daily_litres_hi} लीटर दूध/दिन collect करता है।
+1 लीटर दूध = ${water_per_litre} लीटर पानी।
+मतलब Amul system रोज़ 2600 करोड़ लीटर पानी consume करता है।
+
+📍 बनासकांठा — Amul का सबसे बड़ा union (Banas Dairy):
+→ Groundwater table हर साल गिर रहा है
+→ Bore wells 300+ feet गहरे
+→ किसानों को fodder के लिए पानी चाहिए
+→ लोगों को पीने के लिए पानी नहीं
+
+Amul कहता है: 'दूध भारत की ताक़त है।'
+लेकिन ये ताक़त पानी की बर्बादी पर टिकी है।
+
+🌱 Plant-based दूध: 300 लीटर पानी/लीटर
+🐄 गाय का दूध: ${water_per_litre} लीटर पानी/लीटर
+
+*पानी ख़त्म हो रहा है। विकल्प हैं।*
+""")
+
+
+WATER_FOOTPRINT_ENGLISH = _body("""\
+Amul and Water: Gujarat's Hidden Crisis
+
+Gujarat is one of India's most water-stressed states.
+Gujarat is also India's largest milk producer.
+
+Amul collects ${daily_litres_en} litres/day.
+1 litre of milk = ${water_per_litre} litres of water.
+That's 26 billion litres of water consumed daily by the Amul system.
+
+Banaskantha — Amul's largest union (Banas Dairy):
+- Groundwater table dropping every year
+- Bore wells at 300+ feet
+- Farmers need water for fodder crops
+- Communities lack drinking water
+
+Amul says: 'Milk is India's strength.'
+That strength is built on water depletion.
+
+Plant-based milk: ~300 litres water/litre
+Cow milk: ${water_per_litre} litres water/litre
+
+Water is running out. Alternatives exist.""")
+
+
+OPERATION_FLOOD_CRITIQUE_HINDI = _body("""\
+*Operation Flood: Europe की मदद से बना भारत का dairy system* 🐄
+
+हमें बताया जाता है कि Operation Flood (1970-96) ने भारत को दूध में आत्मनिर्भर बनाया।
+
+लेकिन ये नहीं बताया जाता:
+
+1. पैसा कहाँ से आया? Europe का extra butter और milk powder — जो वो बेच नहीं पा रहे थे — \
+भारत को 'donate' किया गया
+
+2. World Bank ने ${world_bank_loans} से ज़्यादा का loan दिया
+
+3. भारत में पहले दूध की इतनी माँग नहीं थी — Operation Flood ने माँग create की
+
+4. फ़ायदा किसे हुआ? बड़े किसानों को। भूमिहीन ग़रीबों को cooperative में जगह नहीं मिली
+
+5. Cross-breeding: देसी गायों को Holstein-Friesian/Jersey से cross किया — ज़्यादा दूध, \
+लेकिन ज़्यादा बीमारियाँ, ज़्यादा feed ख़र्च, और नर बछड़ों का crisis
+
+*Operation Flood ने दूध बढ़ाया। लेकिन जानवरों, पर्यावरण, और खाद्य सुरक्षा की क़ीमत पर।*
+""")
+
+
+OPERATION_FLOOD_CRITIQUE_ENGLISH = _body("""\
+Operation Flood: How Europe's Dairy Surplus Created India's Dairy Dependency
+
+The standard narrative: Dr. Verghese Kurien and Operation Flood (1970-1996) liberated \
+Indian farmers through dairy cooperatives. India became the world's largest milk \
+producer.
+
+The overlooked facts:
+
+1. FUNDING SOURCE: Operation Flood was primarily funded by the European Economic \
+Community (EEC) donating its dairy surplus — butter oil and milk powder that Europe \
+couldn't sell. This surplus was monetized in India to fund cooperative infrastructure.
+
+2. WORLD BANK LOANS: Three phases of World Bank financing totaling over ${world_bank_loans}. \
+India took loans to import a dairy production model.
+
+3. DEPENDENCY CREATION: Before Operation Flood, India had diverse traditional food \
+systems with lower dairy dependency. Operation Flood specifically aimed to increase \
+per-capita milk consumption — creating demand that didn't previously exist at that \
+scale.
+
+4. WHO BENEFITED: Researchers like Shanti George documented that Operation Flood \
+primarily benefited middle-to-large farmers, not the landless poor. The cooperative \
+model required land (for animals and fodder) that the poorest didn't have.
+
+5. THE CROSSBREEDING PUSH: Operation Flood promoted crossbreeding Indian cattle with \
+Holstein-Friesian and Jersey — creating high-yield animals unsuited to Indian \
+conditions, dependent on purchased feed, and prone to health issues. This is the \
+foundation of today's male calf crisis.
+
+Operation Flood was a development success story by one metric: milk production. By \
+every other metric — animal welfare, environmental sustainability, food sovereignty, \
+equity — it created problems we are only now beginning to understand.
+
+Amul is Operation Flood's monument. The question is whether we want to keep building on \
+that foundation.""")
+
+
+# Citations shared by more than one narrative
+LIVESTOCK_CENSUS_2019 = "20th Livestock Census, 2019"
+
+COOPERATIVE_BETRAYAL_SOURCES = (
+    "GCMMF Annual Report FY2023-24",
+    LIVESTOCK_CENSUS_2019,
+    "FSSAI milk procurement pricing data",
+)
+
+MISSING_CALVES_SOURCES = (
+    f"{LIVESTOCK_CENSUS_2019} (DAHD)",
+    "AWBI reports on calf abandonment",
+    "Field investigations by HSI/India, FIAPO",
+)
+
+WATER_FOOTPRINT_SOURCES = (
+    "CGWB Gujarat monitoring data",
+    "NITI Aayog Composite Water Management Index",
+    "Water Footprint Network data",
+    "GCMMF collection data",
+)
+
+OPERATION_FLOOD_CRITIQUE_SOURCES = (
+    "World Bank Operation Flood project documents (I, II, III)",
+    "Shanti George, 'Operation Flood: An Appraisal of Current Indian Dairy Policy' (1985)",
+    "Claude Alvares, various critiques of Green/White Revolution",
+    "DAHD historical data",
+)
+
+
+NARRATIVE_SPECS = {
+    "cooperative_betrayal": {
+        "title": "Amul: Cooperative Betrayed",
+        "angle": "cooperative_vs_industrial",
+        "target_audience": "Urban consumers, students, socially conscious",
+        "hindi": COOPERATIVE_BETRAYAL_HINDI,
+        "english": COOPERATIVE_BETRAYAL_ENGLISH,
+        "sources": COOPERATIVE_BETRAYAL_SOURCES,
+    },
+    "missing_calves": {
+        "title": "The Missing Calves",
+        "angle": "male_calf_crisis",
+        "target_audience": (
+            "General public, cow protection advocates (challenge their assumptions)"
+        ),
+        "hindi": MISSING_CALVES_HINDI,
+        "english": MISSING_CALVES_ENGLISH,
+        "sources": MISSING_CALVES_SOURCES,
+        "caste_check_notes": (
+            "This narrative avoids cow slaughter framing. It focuses on "
+            "abandonment and starvation, not slaughter. This is deliberate — "
+            "slaughter framing risks being co-opted by cow vigilantes."
+        ),
+    },
+    "water_footprint": {
+        "title": "Amul's Water Footprint",
+        "angle": "water_footprint",
+        "target_audience": "Environmentally conscious, Gujarat residents, water activists",
+        "hindi": WATER_FOOTPRINT_HINDI,
+        "english": WATER_FOOTPRINT_ENGLISH,
+        "sources": WATER_FOOTPRINT_SOURCES,
+    },
+    "operation_flood_critique": {
+        "title": "Operation Flood Critique",
+        "angle": "operation_flood_legacy",
+        "target_audience": "Intellectuals, policy community, food sovereignty advocates",
+        "hindi": OPERATION_FLOOD_CRITIQUE_HINDI,
+        "english": OPERATION_FLOOD_CRITIQUE_ENGLISH,
+        "sources": OPERATION_FLOOD_CRITIQUE_SOURCES,
+    },
+}
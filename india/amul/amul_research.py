@@ -15,11 +15,18 @@ independent research.
 IMPORTANT: All claims must be sourced and verifiable. Do not overstate.
 """
 
+import re
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ResearchPoint:
     """A single research finding with source."""
     claim: str
@@ -31,7 +38,7 @@ class ResearchPoint:
     rebuttal: str = ""  # Rebuttal to Amul's likely response
 
 
-AMUL_PROFILE = {
+AMUL_PROFILE = MappingProxyType({
     "full_name": "Gujarat Cooperative Milk Marketing Federation Ltd (GCMMF)",
     "brand": "Amul (Anand Milk Union Limited)",
     "headquarters": "Amul Dairy Road, Anand - 388001, Gujarat",
@@ -48,7 +55,7 @@ AMUL_PROFILE = {
     "plants": 90,  # processing and packaging plants
     "operation_flood": "Amul model was replicated nationally through Operation Flood (1970-1996), "
                        "funded by World Bank and European dairy surplus. Dr. Verghese Kurien led this.",
-}
+})
 
 
 RESEARCH_DATABASE = {
@@ -229,6 +236,98 @@ RESEARCH_DATABASE = {
     ),
 }
 
+# Topic keys are hashed and compared on every lookup and index build; interning
+# makes keys that arrive from other modules identity-equal to these
+RESEARCH_DATABASE = {sys.intern(key): point for key, point in RESEARCH_DATABASE.items()}
+
+
+def _search_fields(point: ResearchPoint) -> tuple[str, ...]:
+    """Lowercased text fields of a research point that `search` matches against."""
+    return (
+        point.claim.lower(),
+        point.evidence.lower(),
+        point.counter_narrative.lower(),
+    )
+
+
+# Lowercased once at import so search() only lowercases the query
+SEARCH_CORPUS = {key: _search_fields(point) for key, point in RESEARCH_DATABASE.items()}
+
+
+def _build_token_index(corpus: dict[str, tuple[str, ...]]) -> dict[str, frozenset[str]]:
+    """Map each alphanumeric token in the corpus to the topic keys containing it."""
+    index = defaultdict(set)
+    for key, fields in corpus.items():
+        for text in fields:
+            for token in TOKEN_PATTERN.findall(text):
+                index[token].add(key)
+    return {token: frozenset(keys) for token, keys in index.items()}
+
+
+TOKEN_INDEX = _build_token_index(SEARCH_CORPUS)
+
+# Read-only views over the constant research data, shared by every caller
+TOPIC_KEYS = tuple(RESEARCH_DATABASE)
+
+COUNTER_NARRATIVES = MappingProxyType({
+    key: point.counter_narrative
+    for key, point in RESEARCH_DATABASE.items()
+    if point.counter_narrative
+})
+
+REBUTTAL_ROWS = tuple(
+    MappingProxyType({
+        "topic": key,
+        "claim": point.claim,
+        "amul_likely_response": point.amul_response,
+        "our_rebuttal": point.rebuttal,
+        "source": point.source,
+    })
+    for key, point in RESEARCH_DATABASE.items()
+    if point.amul_response and point.rebuttal
+)
+
+
+FACT_SHEET_HEADER = (
+    "AMUL / GCMMF FACT SHEET\n"
+    "{rule}\n"
+    "\n"
+    "Full Name: {full_name}\n"
+    "Brand: {brand}\n"
+    "HQ: {headquarters}\n"
+    "Founded: {founded}\n"
+    "GCMMF Formed: {gcmmf_formed}\n"
+    "Revenue (FY24): Rs. {revenue_fy2024_crore:,} crore\n"
+    "Member Unions: {member_unions}\n"
+    "Farmer Members: {farmer_members:,}\n"
+    "Daily Collection: {daily_milk_collection_litres:,} litres\n"
+    "Processing Plants: {plants}+\n"
+    "Products: {products}+\n"
+    "\n"
+    "KEY ISSUES:\n"
+    "\n"
+)
+
+
+def _fact_sheet_block(key: str, point: ResearchPoint) -> str:
+    """Render one research point's section of the fact sheet."""
+    narrative = f"Narrative: {point.counter_narrative}\n" if point.counter_narrative else ""
+    return (
+        f"--- {key.replace('_', ' ').title()} ---\n"
+        f"Claim: {point.claim}\n"
+        f"Source: {point.source}\n"
+        f"{narrative}"
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_fact_sheet() -> str:
+    """Render the fact sheet once; the profile and research data are constant."""
+    header = FACT_SHEET_HEADER.format(rule="=" * 50, **AMUL_PROFILE)
+    return header + "\n".join(
+        _fact_sheet_block(key, point) for key, point in RESEARCH_DATABASE.items()
+    )
+
 
 class AmulResearchDB:
     """
@@ -236,85 +335,57 @@ class AmulResearchDB:
 
     All claims are sourced and designed to withstand scrutiny.
     The goal is factual counter-narrative, not propaganda.
+
+    The data is module-level and constant, so the class holds no per-instance
+    state; methods can be called on the class or on an instance.
     """
 
-    def __init__(self):
-        self.profile = AMUL_PROFILE
-        self.research = RESEARCH_DATABASE
+    profile = AMUL_PROFILE
+    research = RESEARCH_DATABASE
 
-    def get_profile(self) -> dict:
-        """Get Amul/GCMMF corporate profile."""
-        return self.profile
+    @staticmethod
+    def get_profile() -> Mapping[str, object]:
+        """Get Amul/GCMMF corporate profile (read-only)."""
+        return AMUL_PROFILE
 
-    def get_research_point(self, key: str) -> Optional[ResearchPoint]:
+    @staticmethod
+    def get_research_point(key: str) -> Optional[ResearchPoint]:
         """Get a specific research point."""
-        return self.research.get(key)
+        try:
+            return RESEARCH_DATABASE[key]
+        except KeyError:
+            return None
 
-    def list_research_topics(self) -> list[str]:
+    @staticmethod
+    def list_research_topics() -> tuple[str, ...]:
         """List all research topic keys."""
-        return list(self.research.keys())
+        return TOPIC_KEYS
 
-    def search(self, query: str) -> list[str]:
+    @staticmethod
+    def search(query: str) -> list[str]:
         """Search research database for a keyword."""
         query_lower = query.lower()
-        results = []
-        for key, point in self.research.items():
-            if (query_lower in point.claim.lower() or
-                    query_lower in point.evidence.lower() or
-                    query_lower in point.counter_narrative.lower()):
-                results.append(key)
-        return results
-
-    def get_all_counter_narratives(self) -> dict[str, str]:
-        """Get all counter-narratives as a dict."""
-        return {
-            key: point.counter_narrative
-            for key, point in self.research.items()
-            if point.counter_narrative
-        }
-
-    def get_all_with_rebuttals(self) -> list[dict]:
-        """Get all research points that have rebuttals to Amul's likely responses."""
-        results = []
-        for key, point in self.research.items():
-            if point.amul_response and point.rebuttal:
-                results.append({
-                    "topic": key,
-                    "claim": point.claim,
-                    "amul_likely_response": point.amul_response,
-                    "our_rebuttal": point.rebuttal,
-                    "source": point.source,
-                })
-        return results
-
-    def fact_sheet(self) -> str:
-        """Generate a text fact sheet about Amul for advocacy use."""
-        lines = [
-            "AMUL / GCMMF FACT SHEET",
-            "=" * 50,
-            "",
-            f"Full Name: {self.profile['full_name']}",
-            f"Brand: {self.profile['brand']}",
-            f"HQ: {self.profile['headquarters']}",
-            f"Founded: {self.profile['founded']}",
-            f"GCMMF Formed: {self.profile['gcmmf_formed']}",
-            f"Revenue (FY24): Rs. {self.profile['revenue_fy2024_crore']:,} crore",
-            f"Member Unions: {self.profile['member_unions']}",
-            f"Farmer Members: {self.profile['farmer_members']:,}",
-            f"Daily Collection: {self.profile['daily_milk_collection_litres']:,} litres",
-            f"Processing Plants: {self.profile['plants']}+",
-            f"Products: {self.profile['products']}+",
-            "",
-            "KEY ISSUES:",
-            "",
+        return [
+            key for key, fields in SEARCH_CORPUS.items()
+            if any(query_lower in text for text in fields)
         ]
 
-        for key, point in self.research.items():
-            lines.append(f"--- {key.replace('_', ' ').title()} ---")
-            lines.append(f"Claim: {point.claim}")
-            lines.append(f"Source: {point.source}")
-            if point.counter_narrative:
-                lines.append(f"Narrative: {point.counter_narrative}")
-            lines.append("")
+    @staticmethod
+    def search_token(token: str) -> list[str]:
+        """Find topics containing an exact word (no partial-word matches)."""
+        return sorted(TOKEN_INDEX.get(token.lower(), ()))
+
+    @staticmethod
+    def get_all_counter_narratives() -> Mapping[str, str]:
+        """Get all counter-narratives as a read-only mapping."""
+        return COUNTER_NARRATIVES
 
-        return "\n".join(lines)
+    @staticmethod
+    def get_all_with_rebuttals() -> tuple[Mapping[str, str], ...]:
+        """Get all research points that have rebuttals to Amul's likely responses."""
+        return REBUTTAL_ROWS
+
+    @staticmethod
+    def fact_sheet() -> str:
+        """Generate a text fact sheet about Amul for advocacy use."""
+        return _build_fact_sheet()
@@ -0,0 +1,121 @@
+"""
+Amul/GCMMF research and counter-narrative commands.
+
+Loaded on demand by india.cli when the `amul` group is invoked.
+"""
+
+from functools import lru_cache
+
+import click
+
+
+@lru_cache(maxsize=1)
+def _amul_db():
+    from india.amul.amul_research import AmulResearchDB
+
+    return AmulResearchDB()
+
+
+@lru_cache(maxsize=1)
+def _narrative_gen():
+    from india.amul.narrative_generator import NarrativeGenerator
+
+    return NarrativeGenerator()
+
+
+@click.group()
+def amul():
+    """Amul/GCMMF counter-narrative tools."""
+    pass
+
+
+@amul.command("fact-sheet")
+def amul_fact_sheet():
+    """Print Amul fact sheet."""
+    db = _amul_db()
+    click.echo(db.fact_sheet())
+
+
+@amul.command("research")
+@click.option("--topic", default=None, help="Get research on specific topic")
+@click.option("--search", default=None, help="Search research database")
+@click.option("--list", "list_all", is_flag=True, help="List all topics")
+@click.option("--rebuttals", is_flag=True, help="Show claim-response-rebuttal chains")
+def amul_research(topic, search, list_all, rebuttals):
+    """Amul research database."""
+    db = _amul_db()
+
+    if topic:
+        point = db.get_research_point(topic)
+        if point:
+            click.echo(f"Claim: {point.claim}")
+            click.echo(f"\nEvidence: {point.evidence}")
+            click.echo(f"\nSource: {point.source}")
+            if point.counter_narrative:
+                click.echo(f"\nCounter-narrative: {point.counter_narrative}")
+            if point.amul_response:
+                click.echo(f"\nAmul's likely response: {point.amul_response}")
+            if point.rebuttal:
+                click.echo(f"\nOur rebuttal: {point.rebuttal}")
+        else:
+            click.echo(f"Topic not found: {topic}")
+    elif search:
+        results = db.search(search)
+        for r in results:
+            click.echo(f"  {r}")
+    elif rebuttals:
+        lines = []
+        for item in db.get_all_with_rebuttals():
+            lines.extend((
+                f"\n--- {item['topic']} ---",
+                f"Claim: {item['claim']}",
+                f"Amul says: {item['amul_likely_response']}",
+                f"Rebuttal: {item['our_rebuttal']}",
+            ))
+        click.echo("\n".join(lines))
+    elif list_all:
+        for t in db.list_research_topics():
+            click.echo(f"  {t}")
+    else:
+        click.echo("Use --topic, --search, --list, or --rebuttals.")
+
+
+@amul.command("narrative")
+@click.option("--type", "narrative_type", default=None,
+              help="Narrative type (cooperative_betrayal, missing_calves, water_footprint, operation_flood_critique)")
+@click.option("--platform", default="whatsapp", help="Platform (whatsapp, article)")
+@click.option("--list", "list_all", is_flag=True, help="List available narratives")
+@click.option("--all", "generate_all", is_flag=True, help="Generate all narratives")
+def amul_narrative(narrative_type, platform, list_all, generate_all):
+    """Generate Amul counter-narratives."""
+    gen = _narrative_gen()
+
+    if list_all:
+        for n in gen.list_narratives():
+            click.echo(f"  {n}")
+    elif generate_all:
+        # click.echo flushes, so each narrative reaches a pipe as soon as it is built
+        for narrative in gen.iter_all(platform):
+            click.echo("\n".join((
+                f"\n{'=' * 60}",
+                f"Title: {narrative.title}",
+                f"Angle: {narrative.angle}",
+                "=" * 60,
+                narrative.content_english,
+            )))
+    elif narrative_type:
+        narratives = gen.list_narratives()
+        if narrative_type in narratives:
+            narrative = getattr(gen, narrative_type)(platform)
+            click.echo(f"Title: {narrative.title}")
+            click.echo(f"Platform: {narrative.platform}")
+            click.echo(f"\n--- HINDI ---")
+            click.echo(narrative.content_hindi)
+            click.echo(f"\n--- ENGLISH ---")
+            click.echo(narrative.content_english)
+            click.echo(f"\nSources: {', '.join(narrative.sources)}")
+        else:
+            click.echo(f"Unknown narrative type: {narrative_type}")
+            click.echo(f"Available: {', '.join(narratives)}")
+    else:
+        click.echo("Use --type, --list, or --all.")
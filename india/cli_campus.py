@@ -0,0 +1,143 @@
+"""
+Campus and Bangalore tech community advocacy commands.
+
+Loaded on demand by india.cli when the `campus` group is invoked.
+"""
+
+from functools import lru_cache
+
+import click
+
+from india._json import dumps
+
+CSR_FOCUS_CHOICE = click.Choice(["food_safety", "tech_for_good"])
+
+
+@lru_cache(maxsize=1)
+def _campus_toolkit():
+    from india.campus.campus_toolkit import CampusToolkit
+
+    return CampusToolkit()
+
+
+@lru_cache(maxsize=1)
+def _bangalore_hub():
+    from india.campus.bangalore_hub import BangaloreHub
+
+    return BangaloreHub()
+
+
+@click.group()
+def campus():
+    """Campus advocacy toolkit."""
+    pass
+
+
+@campus.command("hackathon")
+@click.option("--list", "list_all", is_flag=True, help="List hackathon problems")
+def campus_hackathon(list_all):
+    """Hackathon problem statements."""
+    toolkit = _campus_toolkit()
+    problems = toolkit.hackathon_problems()
+
+    lines = []
+    for p in problems:
+        lines.extend((
+            f"\n{'=' * 60}",
+            f"Title: {p.title}",
+            f"Difficulty: {p.difficulty}",
+            f"Description: {p.description}",
+            f"Impact Metric: {p.impact_metric}",
+            f"Data Sources: {', '.join(p.data_sources)}",
+            f"Tech Stack: {', '.join(p.tech_stack_suggestions)}",
+        ))
+    click.echo("\n".join(lines))
+
+
+@campus.command("club-constitution")
+def campus_club():
+    """Club constitution template."""
+    toolkit = _campus_toolkit()
+    constitution = toolkit.club_constitution()
+
+    click.echo(f"Name Suggestions: {', '.join(constitution.name_suggestions)}")
+    click.echo(f"\nMission: {constitution.mission}")
+    click.echo(f"\nObjectives:")
+    for obj in constitution.objectives:
+        click.echo(f"  - {obj}")
+    click.echo(f"\nActivities:")
+    for act in constitution.activities:
+        click.echo(f"  - {act}")
+    click.echo(f"\nMembership: {constitution.membership_criteria}")
+    click.echo(f"\nAffiliation: {constitution.affiliation_notes}")
+
+
+@campus.command("workshop")
+def campus_workshop():
+    """AI Ethics workshop module."""
+    toolkit = _campus_toolkit()
+    workshop = toolkit.ai_ethics_workshop()
+    click.echo(dumps(workshop))
+
+
+@campus.command("bangalore")
+@click.option("--meetups", is_flag=True, help="Show meetup templates")
+@click.option("--ecosystem", is_flag=True, help="Show startup ecosystem")
+@click.option("--partnerships", is_flag=True, help="Show partnership opportunities")
+@click.option("--calendar", is_flag=True, help="Show content calendar template")
+def campus_bangalore(meetups, ecosystem, partnerships, calendar):
+    """Bangalore tech community hub."""
+    hub = _bangalore_hub()
+
+    if meetups:
+        lines = []
+        for m in hub.meetup_templates():
+            lines.extend((
+                f"\n{'=' * 60}",
+                f"Title: {m.title}",
+                f"Format: {m.format}",
+                f"Duration: {m.duration}",
+                f"Target: {m.target_audience}",
+                f"Est. Attendance: {m.estimated_attendance}",
+                "\nAgenda:",
+            ))
+            lines.extend(f"  {item}" for item in m.agenda)
+        click.echo("\n".join(lines))
+    elif ecosystem:
+        # Convert the profiles upfront so the encoder never calls back into Python
+        ecosystem = hub.startup_ecosystem_map()
+        click.echo(dumps({
+            "alt_protein_startups": [s.to_dict() for s in ecosystem["alt_protein_startups"]],
+            "relevant_vcs": ecosystem["relevant_vcs"],
+            "organizations": [o.to_dict() for o in ecosystem["organizations"]],
+        }))
+    elif partnerships:
+        for p in hub.partnership_opportunities():
+            click.echo(f"\n  {p['partner']} ({p['type']})")
+            click.echo(f"  {p['opportunity']}")
+    elif calendar:
+        cal = hub.content_calendar_template()
+        click.echo(dumps(cal))
+    else:
+        click.echo("Use --meetups, --ecosystem, --partnerships, or --calendar.")
+
+
+@campus.command("csr")
+@click.option("--company", default="[COMPANY]", help="Company name")
+@click.option("--focus", default="food_safety",
+              type=CSR_FOCUS_CHOICE,
+              help="CSR focus area")
+def campus_csr(company, focus):
+    """CSR proposal template."""
+    toolkit = _campus_toolkit()
+    proposal = toolkit.csr_proposal_template(company, focus)
+
+    click.echo(f"Title: {proposal.title}")
+    click.echo(f"\nExecutive Summary: {proposal.executive_summary}")
+    click.echo(f"\nProblem: {proposal.problem_statement}")
+    click.echo(f"\nSolution: {proposal.proposed_solution}")
+    click.echo(f"\nBudget: {proposal.budget_outline}")
+    click.echo(f"\nImpact Metrics:")
+    for m in proposal.impact_metrics:
+        click.echo(f"  - {m}")
+    click.echo(f"\nCSR Act Alignment: {proposal.alignment_with_csr_act}")
@@ -0,0 +1,96 @@
+"""
+Hindi content and cultural framing commands.
+
+Loaded on demand by india.cli when the `content` group is invoked.
+"""
+
+from functools import lru_cache
+
+import click
+
+
+@lru_cache(maxsize=1)
+def _hindi_translator():
+    from india.content.hindi_translator import HindiTranslator
+
+    return HindiTranslator()
+
+
+@lru_cache(maxsize=1)
+def _cultural_framer():
+    from india.content.cultural_framing import CulturalFramer
+
+    return CulturalFramer()
+
+
+@click.group()
+def content():
+    """Hindi content and cultural framing."""
+    pass
+
+
+@content.command("dairy-facts")
+@click.option("--hindi", is_flag=True, help="Output Hindi version")
+def content_dairy_facts(hindi):
+    """WhatsApp-ready dairy industry facts."""
+    translator = _hindi_translator()
+    click.echo(translator.dairy_facts_hindi())
+
+
+@content.command("water-crisis")
+def content_water_crisis():
+    """WhatsApp-ready water crisis content."""
+    translator = _hindi_translator()
+    click.echo(translator.water_crisis_hindi())
+
+
+@content.command("glossary")
+def content_glossary():
+    """Hindi advocacy glossary."""
+    translator = _hindi_translator()
+    for eng, (roman, deva) in translator.get_glossary().items():
+        click.echo(f"  {eng:20s} — {roman:20s} ({deva})")
+
+
+@content.command("language-guide")
+def content_language_guide():
+    """Guidelines for writing accessible Hindi."""
+    translator = _hindi_translator()
+    click.echo(translator.language_guide())
+
+
+@content.command("frames")
+@click.option("--list", "list_all", is_flag=True, help="List available frames")
+@click.option("--detail", default=None, help="Get frame details")
+@click.option("--check", default=None, help="Check text for caste sensitivity issues")
+def content_frames(list_all, detail, check):
+    """Cultural framing tools."""
+    framer = _cultural_framer()
+
+    if detail:
+        frame = framer.get_frame(detail)
+        if frame:
+            lines = [
+                f"Frame: {frame.name}",
+                f"Description: {frame.description}",
+                "\nKey Messages:",
+            ]
+            lines.extend(f"  - {msg}" for msg in frame.key_messages)
+            lines.append("\nDO use:")
+            lines.extend(f"  + {item}" for item in frame.do_use)
+            lines.append("\nDO NOT use:")
+            lines.extend(f"  - {item}" for item in frame.do_not_use)
+            lines.append(f"\nExample: {frame.example_content}")
+            click.echo("\n".join(lines))
+        else:
+            click.echo(f"Frame not found: {detail}")
+    elif check:
+        warnings = framer.caste_sensitivity_check(check)
+        for w in warnings:
+            click.echo(f"  WARNING: {w}")
+    elif list_all:
+        for name in framer.list_frames():
+            frame = framer.get_frame(name)
+            click.echo(f"  {name:30s} — {frame.name}")
+    else:
+        click.echo("Use --list, --detail <frame>, or --check <text>.")
@@ -0,0 +1,70 @@
+"""
+Factory farm mapping commands.
+
+Loaded on demand by india.cli when the `map` group is invoked.
+"""
+
+from functools import lru_cache
+
+import click
+
+from india._json import dumps
+
+
+@lru_cache(maxsize=1)
+def _facility_mapper():
+    from india.mapping.facility_mapper import FacilityMapper
+
+    return FacilityMapper()
+
+
+@lru_cache(maxsize=1)
+def _pollution_overlay():
+    from india.mapping.pollution_overlay import PollutionOverlay
+
+    return PollutionOverlay()
+
+
+@click.group("map")
+def map_cmd():
+    """Factory farm mapping tools."""
+    pass
+
+
+@map_cmd.command("operators")
+@click.option("--list", "list_all", is_flag=True, help="List all major operators")
+@click.option("--detail", default=None, help="Get operator details")
+def map_operators(list_all, detail):
+    """Major animal agriculture operators."""
+    mapper = _facility_mapper()
+
+    if detail:
+        info = mapper.get_operator_info(detail)
+        if info:
+            click.echo(dumps(info))
+        else:
+            click.echo(f"Operator not found: {detail}")
+            click.echo(f"Available: {', '.join(o['key'] for o in mapper.list_operators())}")
+    elif list_all:
+        for op in mapper.list_operators():
+            click.echo(f"  {op['key']:25s} — {op['name']} ({op['type']})")
+    else:
+        click.echo("Use --list or --detail <key>.")
+
+
+@map_cmd.command("census")
+@click.option("--state", required=True, help="State name")
+def map_census(state):
+    """Livestock census data for a state."""
+    mapper = _facility_mapper()
+    data = mapper.get_livestock_census_context(state)
+    click.echo(dumps(data))
+
+
+@map_cmd.command("hotspots")
+def map_hotspots():
+    """Known pollution hotspots from animal agriculture."""
+    overlay = _pollution_overlay()
+    for h in overlay.get_known_hotspots():
+        click.echo(f"\n  {h['area']} ({h['type']})")
+        click.echo(f"  {h['description']}")
@@ -0,0 +1,110 @@
+"""
+PIL research commands backed by the legal database.
+
+Loaded on demand by india.cli when the `pil` group is invoked.
+"""
+
+from functools import lru_cache
+
+import click
+
+
+@lru_cache(maxsize=1)
+def _legal_db():
+    from india.legal.pil_research import LegalDatabase
+
+    return LegalDatabase.instance()
+
+
+@click.group()
+def pil():
+    """PIL research and templates."""
+    pass
+
+
+@pil.command("research")
+@click.option("--search", default=None, help="Search legal database")
+@click.option("--case", default=None, help="Get case details")
+@click.option("--statute", default=None, help="Get statute details")
+@click.option("--provision", default=None, help="Get constitutional provision")
+@click.option("--citations", default=None, help="Get recommended citations for a topic")
+def pil_research(search, case, statute, provision, citations):
+    """Search the legal database."""
+    from india.legal.pil_research import LandmarkCase, LegalProvision
+
+    db = _legal_db()
+
+    if search:
+        results = db.search(search)
+        click.echo(f"Results for '{search}':")
+        for category, items in results.items():
+            if items:
+                click.echo(f"  {category}: {', '.join(items)}")
+    elif case:
+        c = db.get_case(case)
+        if c:
+            click.echo(f"Case: {c.name}")
+            click.echo(f"Citation: {c.full_citation}")
+            click.echo(f"Court: {c.court}")
+            click.echo(f"Holding: {c.holding}")
+            click.echo(f"Key Principles:")
+            for p in c.key_principles:
+                click.echo(f"  - {p}")
+            click.echo(f"Advocacy Use: {c.relevance_to_advocacy}")
+        else:
+            click.echo(f"Case not found: {case}")
+            click.echo(f"Available: {', '.join(db.list_all_cases())}")
+    elif statute:
+        s = db.get_statute(statute)
+        if s:
+            click.echo(f"Statute: {s.title}")
+            click.echo(f"Text: {s.text}")
+            click.echo(f"Relevance: {s.relevance}")
+            click.echo(f"Advocacy Use: {s.advocacy_use}")
+        else:
+            click.echo(f"Statute not found: {statute}")
+            click.echo(f"Available: {', '.join(db.list_all_statutes())}")
+    elif provision:
+        p = db.get_provision(provision)
+        if p:
+            click.echo(f"Provision: {p.identifier} — {p.title}")
+            click.echo(f"Text: {p.text}")
+            click.echo(f"Advocacy Use: {p.advocacy_use}")
+        else:
+            click.echo(f"Provision not found: {provision}")
+            click.echo(f"Available: {', '.join(db.list_all_provisions())}")
+    elif citations:
+        cites = db.get_pil_citations(citations)
+        click.echo(f"Recommended citations for: {citations}")
+        for category, items in cites.items():
+            click.echo(f"\n  {category}:")
+            for item in items:
+                if isinstance(item, LegalProvision):
+                    click.echo(f"    - {item.identifier}: {item.title}")
+                elif isinstance(item, LandmarkCase):
+                    click.echo(f"    - {item.name} ({item.citation})")
+    else:
+        click.echo("Use --search, --case, --statute, --provision, or --citations.")
+
+
+@pil.command("list")
+@click.option("--cases", is_flag=True, help="List all cases")
+@click.option("--statutes", is_flag=True, help="List all statutes")
+@click.option("--provisions", is_flag=True, help="List all provisions")
+def pil_list(cases, statutes, provisions):
+    """List available legal materials."""
+    db = _legal_db()
+    if cases:
+        for key in db.list_all_cases():
+            c = db.get_case(key)
+            click.echo(f"  {key:30s} — {c.name} ({c.citation})")
+    elif statutes:
+        for key in db.list_all_statutes():
+            s = db.get_statute(key)
+            click.echo(f"  {key:35s} — {s.title}")
+    elif provisions:
+        for key in db.list_all_provisions():
+            p = db.get_provision(key)
+            click.echo(f"  {key:20s} — {p.identifier}: {p.title}")
+    else:
+        click.echo("Use --cases, --statutes, or --provisions.")
@@ -0,0 +1,151 @@
+"""
+RTI Act 2005 commands: generate, list and track applications.
+
+Loaded on demand by india.cli when the `rti` group is invoked.
+"""
+
+import sys
+from functools import lru_cache
+
+import click
+
+from india._json import dumps
+
+LANGUAGE_CHOICE = click.Choice(["english", "hindi", "bilingual"])
+
+
+@lru_cache(maxsize=1)
+def _rti_generator():
+    from india.rti.rti_generator import RTIGenerator
+
+    return RTIGenerator()
+
+
+@click.group()
+def rti():
+    """RTI Act 2005 tools — generate, file, track."""
+    pass
+
+
+@rti.command("generate")
+@click.option("--agency", required=True, help="Agency code (awbi, fssai, cpcb, dahd, nlm, rgm)")
+@click.option("--template", default=None, help="Template name (e.g., awbi_inspection.txt)")
+@click.option("--name", required=True, help="Applicant name")
+@click.option("--address", required=True, help="Applicant address")
+@click.option("--state", default=None, help="State (for state-level bodies)")
+@click.option("--district", default=None, help="District")
+@click.option("--language", default="english", type=LANGUAGE_CHOICE)
+@click.option("--subject", default="", help="RTI subject line")
+@click.option("--output", default=None, help="Output file path")
+def rti_generate(agency, template, name, address, state, district, language, subject, output):
+    """Generate an RTI application."""
+    from india.rti.rti_generator import RTIApplication
+
+    generator = _rti_generator()
+
+    agencies = generator.list_agencies()
+    if agency not in agencies:
+        click.echo(f"Unknown agency: {agency}")
+        click.echo(f"Available: {', '.join(agencies)}")
+        sys.exit(1)
+
+    app = RTIApplication(
+        agency_code=agency,
+        questions=["[Questions will be loaded from template or must be specified]"],
+        applicant_name=name,
+        applicant_address=address,
+        language=language,
+        state=state,
+        district=district,
+        subject=subject,
+    )
+
+    if template:
+        text = generator.generate_from_template(template, app)
+    else:
+        text = generator.generate(app)
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text)
+        click.echo(f"RTI application saved to: {output}")
+    else:
+        click.echo(text)
+
+
+@rti.command("agencies")
+def rti_agencies():
+    """List supported agencies."""
+    generator = _rti_generator()
+    for code in generator.list_agencies():
+        info = generator.get_agency_info(code)
+        click.echo(f"  {code:8s} — {info['name']}")
+
+
+@rti.command("templates")
+def rti_templates():
+    """List available RTI templates."""
+    generator = _rti_generator()
+    templates = generator.list_templates()
+    if templates:
+        for t in templates:
+            click.echo(f"  {t}")
+    else:
+        click.echo("No templates found.")
+
+
+@rti.command("track")
+@click.option("--list", "list_all", is_flag=True, help="List all tracked RTIs")
+@click.option("--overdue", is_flag=True, help="Show overdue RTIs")
+@click.option("--upcoming", is_flag=True, help="Show upcoming deadlines (7 days)")
+@click.option("--stats", is_flag=True, help="Show statistics")
+@click.option("--export", default=None, help="Export to JSON file")
+def rti_track(list_all, overdue, upcoming, stats, export):
+    """Track filed RTI applications."""
+    from india.rti.rti_tracker import RTITracker
+
+    tracker = RTITracker()
+
+    if stats:
+        s = tracker.get_stats()
+        click.echo(dumps(s))
+    elif overdue:
+        records = tracker.get_overdue()
+        if records:
+            lines = []
+            for r in records:
+                lines.extend((
+                    f"  [{r['id']}] {r['agency_name']} — {r['subject']}",
+                    f"       Filed: {r['filing_date']} | Deadline: {r['response_deadline']}",
+                    f"       Days overdue: {r['days_since_filing'] - 30}",
+                ))
+            click.echo("\n".join(lines))
+        else:
+            click.echo("No overdue RTIs.")
+    elif upcoming:
+        records = tracker.get_upcoming_deadlines(7)
+        if records:
+            lines = []
+            for r in records:
+                lines.extend((
+                    f"  [{r['id']}] {r['agency_name']} — {r['subject']}",
+                    f"       Deadline: {r['response_deadline']}",
+                ))
+            click.echo("\n".join(lines))
+        else:
+            click.echo("No upcoming deadlines in next 7 days.")
+    elif export:
+        tracker.export_json(export)
+        click.echo(f"Exported to: {export}")
+    elif list_all:
+        records = tracker.get_all()
+        if records:
+            lines = []
+            for r in records:
+                status = r['status'] or 'unknown'
+                lines.append(f"  [{r['id']}] [{status:20s}] {r['agency_name']} — {r['subject']}")
+            click.echo("\n".join(lines))
+        else:
+            click.echo("No RTIs tracked yet.")
+    else:
+        click.echo("Use --list, --overdue, --upcoming, --stats, or --export.")
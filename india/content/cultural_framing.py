@@ -25,23 +25,94 @@ without reinforcing harmful narratives. Key frames:
    Adivasi land rights, small farmer movements.
 """
 
+import re
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional, Union
+
+# Terms flagged by CulturalFramer.caste_sensitivity_check, in report order
+PROBLEMATIC_TERMS = MappingProxyType({
+    "gau mata": "Avoid 'gau mata' — entangled with Hindutva cow vigilantism",
+    "gau raksha": "Avoid 'gau raksha' — associated with violence against Dalits and Muslims",
+    "pure vegetarian": "Avoid 'pure vegetarian' — implies impurity of meat-eaters (casteist)",
+    "shuddh shakahari": "Avoid 'shuddh shakahari' — purity language is casteist",
+    "satvik": "Caution with 'satvik' — can reinforce caste hierarchy through food",
+    "tamsik": "Avoid 'tamsik' — designating foods as 'impure' reinforces caste hierarchy",
+    "rajsik": "Caution with Ayurvedic food classification — often maps to caste hierarchy",
+    "beef ban": "Handle carefully — beef bans have been weaponized against Dalits and Muslims",
+    "cow slaughter": "Handle carefully — cow protection movement has caused lynchings",
+    "vegan nation": "Avoid nationalist framing of veganism — exclusionary",
+    "ancient wisdom": (
+        "Caution — 'ancient Indian wisdom' rhetoric often means upper-caste Brahminical texts"
+    ),
+})
+
+_PROBLEMATIC_TERM_PAIRS = tuple(PROBLEMATIC_TERMS.items())
+
+
+def _term_pattern(terms: Iterable[str]) -> re.Pattern:
+    """
+    One-pass pattern for a set of terms; group 1 is the term found.
+
+    The lookahead keeps overlapping terms from hiding each other, but only
+    the first alternative that matches at a position is reported, so longer
+    terms go first. A shorter term they contain is recovered by _find_terms.
+    """
+    alternatives = sorted(terms, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, alternatives)) + "))")
+
 
+def _contained_terms(terms: Iterable[str]) -> Mapping[str, tuple[str, ...]]:
+    """Map each term to the other terms that occur inside it."""
+    terms = tuple(terms)
+    return MappingProxyType({t: tuple(o for o in terms if o != t and o in t) for t in terms})
 
-@dataclass
+
+def _find_terms(
+    text_lower: str, pattern: re.Pattern, contained: Mapping[str, tuple[str, ...]]
+) -> set[str]:
+    """Every term occurring in text_lower, including ones inside a longer match."""
+    found = set()
+    for match in pattern.finditer(text_lower):
+        term = match.group(1)
+        found.add(term)
+        found.update(contained[term])
+    return found
+
+
+_PROBLEMATIC_TERMS_RE = _term_pattern(PROBLEMATIC_TERMS)
+_PROBLEMATIC_SUBTERMS = _contained_terms(PROBLEMATIC_TERMS)
+
+# Content mentioning any MEAT_PROCESSING_TERMS should also mention workers.
+# Both are matched as substrings so that "slaughterhouse" and "workers" count.
+MEAT_PROCESSING_TERMS = ("slaughter", "meat plant", "processing")
+WORKER_TERMS = ("worker", "labour", "labor", "mazdoor")
+_MEAT_PROCESSING_RE = re.compile("|".join(map(re.escape, MEAT_PROCESSING_TERMS)))
+_WORKER_RE = re.compile("|".join(map(re.escape, WORKER_TERMS)))
+
+# Topic keywords behind each frame recommendation, matched as substrings so
+# plurals such as "cows" and "eggs" still count
+_DAIRY_TOPIC_RE = re.compile("dairy|milk|cow|buffalo|amul")
+_POULTRY_TOPIC_RE = re.compile("poultry|chicken|egg|factory")
+_WORKER_TOPIC_RE = re.compile("slaughter|meat|worker")
+_ENVIRONMENT_TOPIC_RE = re.compile("water|pollution|environment")
+_TRADITION_TOPIC_RE = re.compile("tradition|culture|values")
+
+
+@dataclass(slots=True, frozen=True)
 class CulturalFrame:
     """A cultural framing approach for advocacy content."""
     name: str
     description: str
-    key_messages: list[str]
+    key_messages: tuple[str, ...]
     target_audience: str
-    do_use: list[str]
-    do_not_use: list[str]
+    do_use: tuple[str, ...]
+    do_not_use: tuple[str, ...]
     example_content: str
 
 
-FRAMES = {
+FRAMES = MappingProxyType({
     "ahimsa": CulturalFrame(
         name="Ahimsa (Non-violence)",
         description=(
@@ -49,28 +120,28 @@ FRAMES = {
             "Gandhian, and broader Indian philosophy. Frame factory farming as a "
             "violation of ahimsa that all traditions agree on."
         ),
-        key_messages=[
+        key_messages=(
             "Factory farming is organized violence. Ahimsa demands we confront it.",
             "Gandhi said: 'The greatness of a nation can be judged by the way its animals are treated.'",
             "Ahimsa is not just not-killing. It is actively preventing suffering.",
             "Every Indian tradition values compassion for animals. Factory farms betray all of them.",
             "Jain ahimsa teaches that even indirect violence (through consumption) matters.",
-        ],
+        ),
         target_audience="General Indian audience, especially those who identify with ahimsa traditions",
-        do_use=[
+        do_use=(
             "Gandhi quotes on animals and non-violence (well-sourced)",
             "Jain tradition of animal protection and sanctuaries (panjrapoles)",
             "Buddhist first precept (do not harm living beings)",
             "Cross-traditional consensus on compassion",
             "Modern interpretation: ahimsa as active resistance to industrial cruelty",
-        ],
-        do_not_use=[
+        ),
+        do_not_use=(
             "Hindu nationalist cow rhetoric",
             "Framing vegetarianism as 'Hindu' or 'upper caste'",
             "Using ahimsa to shame meat-eaters (especially Dalit/Adivasi/Muslim communities)",
             "Implying that those who eat meat are 'less Indian'",
             "Sanskrit-heavy language that alienates non-Hindi speakers",
-        ],
+        ),
         example_content=(
             "Gandhi ji ne kaha tha: 'Kisi desh ki mahanata aur uski tarakki ka andaaza "
             "is baat se lagaaya ja sakta hai ki woh apne janwaron ke saath kaisa "
@@ -87,27 +158,27 @@ FRAMES = {
             "synthetic milk), antibiotic residues, and aflatoxin M1 contamination. "
             "This is a health argument, not a moral one."
         ),
-        key_messages=[
+        key_messages=(
             "FSSAI ki jaanch mein doodh mein milaawat paai gayi — urea, detergent, starch.",
             "Dairy industry mein antibiotics ka bharee istemaal hota hai. Ye doodh ke zariye aapke sharir mein aata hai.",
             "Antibiotic resistance duniya ki sabse badi health crisis ban rahi hai. Dairy ek bada kaaran hai.",
             "India mein har saal hazaaron log milaawati doodh se beemar hote hain.",
             "Aapke bachche kya pee rahe hain? Jaaniye, phir faisla kijiye.",
-        ],
+        ),
         target_audience="Parents, health-conscious consumers, urban middle class",
-        do_use=[
+        do_use=(
             "FSSAI survey data (National Milk Quality Survey)",
             "WHO reports on antibiotic resistance",
             "Specific adulteration incidents (named, dated)",
             "Health impact data: cancer, antibiotic resistance, hormonal disruption",
             "Economic framing: you pay for pure milk, you get chemicals",
-        ],
-        do_not_use=[
+        ),
+        do_not_use=(
             "Shaming milk drinkers",
             "Claiming all milk is 'poison' (be specific and evidence-based)",
             "Targeting specific communities' food practices",
             "Unverified health claims",
-        ],
+        ),
         example_content=(
             "Kya aap jaante hain? FSSAI ki 2018 National Milk Quality Survey "
             "mein paaya gaya ki 41% doodh ke samples standards ke mutaabiq "
@@ -123,26 +194,26 @@ FRAMES = {
             "dairy and poultry's enormous water footprint to this crisis is "
             "powerful and non-controversial."
         ),
-        key_messages=[
+        key_messages=(
             "1 litre doodh = 1000+ litre paani. Jab gaanvon mein peene ka paani nahi, toh ye sahi hai?",
             "NITI Aayog: 2030 tak paani ki maang supply se doguni ho jaayegi.",
             "Poultry farming mein bhi karodon litre paani lagta hai — feed ugaane aur processing mein.",
             "Gujarat ke dairy belt (Banaskantha) mein groundwater khatarnaak level tak gir gaya hai.",
             "Plant-based khaane mein 80% kam paani lagta hai.",
-        ],
+        ),
         target_audience="Everyone — water scarcity affects all classes and communities",
-        do_use=[
+        do_use=(
             "NITI Aayog water crisis report (Composite Water Management Index)",
             "Central Ground Water Board data on groundwater depletion",
             "Water footprint comparisons (milk vs. plant milk, chicken vs. dal)",
             "District-level water stress data for agricultural areas",
             "Summer water tanker images — visceral and real",
-        ],
-        do_not_use=[
+        ),
+        do_not_use=(
             "Blaming farmers individually",
             "Ignoring industrial water use (textiles, mining) — be fair",
             "Overstating claims without data",
-        ],
+        ),
         example_content=(
             "Banaskantha, Gujarat — desh ka sabse bada doodh utpaadak zila. "
             "CGWB ke data ke mutaabiq, yahan groundwater level har saal 1-2 "
@@ -159,26 +230,26 @@ FRAMES = {
             "transfer all risk to farmers while extracting profit. Amul's cooperative "
             "model is increasingly industrialized."
         ),
-        key_messages=[
+        key_messages=(
             "Suguna ka contract farming model: company ka munafa, kisaan ka nuqsaan.",
             "Murgi paalne wale kisaan ko 2-3 rupaye milte hain. Company ko 20-30.",
             "Factory farming se bade kisaan aur corporations ameer hote hain. Chhote kisaan barbad.",
             "Dairy industry Rs 10 lakh crore ki hai. Kitna paisa gaay paalne wale ko milta hai?",
             "Amul cooperative hai ya corporate? Rs 72,000 crore revenue — kisaan ko kitna?",
-        ],
+        ),
         target_audience="Farmers, rural communities, economically aware audiences",
-        do_use=[
+        do_use=(
             "Company annual reports (publicly available for listed companies)",
             "Contract farming terms — risk-reward imbalance",
             "Milk procurement prices vs. retail prices (farmer share)",
             "Subsidy data (NLM, RGM) — who benefits?",
             "Small farmer displacement data",
-        ],
-        do_not_use=[
+        ),
+        do_not_use=(
             "Anti-business rhetoric without data",
             "Ignoring that farmers need income (always propose alternatives)",
             "Romanticizing subsistence farming",
-        ],
+        ),
         example_content=(
             "Suguna Foods — India ki sabse badi poultry company. Revenue: "
             "Rs 18,000 crore+. Contract farmer ko milta hai: har murge "
@@ -196,7 +267,7 @@ FRAMES = {
             "Our frame MUST center food sovereignty and economic justice, "
             "NOT dietary policing."
         ),
-        key_messages=[
+        key_messages=(
             "Har insaan ko ye haq hai ki woh decide kare ki kya khaaye. "
             "Food sovereignty sabka haq hai.",
             "Factory farming se sabse zyada nuqsaan Dalit aur garib communities ko hota hai — "
@@ -207,24 +278,24 @@ FRAMES = {
             "unki suraksha — ye hamara masla hai.",
             "Occupational hazards: slaughterhouse workers face respiratory disease, "
             "injuries, mental health impacts — and no safety protections.",
-        ],
+        ),
         target_audience="Social justice communities, labor movements, progressive organizations",
-        do_use=[
+        do_use=(
             "Worker safety data from slaughterhouses and poultry farms",
             "Economic exploitation of contract farming laborers",
             "Environmental racism: factory farms located near marginalized communities",
             "Solidarity framing: factory farming harms animals AND workers",
             "Quote Dalit-Bahujan thinkers who have written on food sovereignty",
             "Center the voices and agency of affected communities",
-        ],
-        do_not_use=[
+        ),
+        do_not_use=(
             "NEVER: 'go vegetarian' messaging aimed at Dalit/Muslim communities",
             "NEVER: purity/pollution language about food",
             "NEVER: cow protection rhetoric (deeply entangled with anti-Dalit violence)",
             "NEVER: assume that all Dalits eat meat or that diet defines caste identity",
             "NEVER: speak FOR communities instead of amplifying their own voices",
             "NEVER: ignore that cow vigilantism has killed Dalits and Muslims",
-        ],
+        ),
         example_content=(
             "Factory farming ka sabse bada nuqsaan un logon ko hota hai jo "
             "ismein kaam karte hain. Poultry farm workers ko din mein 12-14 "
@@ -234,7 +305,89 @@ FRAMES = {
             "Ye insaaf ka masla hai."
         ),
     ),
-}
+})
+
+FRAME_NAMES = tuple(FRAMES)
+
+DO_NOT_USE_GUIDELINES = MappingProxyType({
+    name: frame.do_not_use for name, frame in FRAMES.items()
+})
+
+
+@dataclass(slots=True, frozen=True)
+class NormalizedText:
+    """Text with its lowercase form, so several checks can share one lower() pass."""
+    raw: str
+    lowered: str
+
+
+def normalize(text: str) -> NormalizedText:
+    """Lowercase text once for repeated recommend_frames/caste_sensitivity_check calls."""
+    return NormalizedText(text, text.lower())
+
+
+def _lowered(text: Union[str, NormalizedText]) -> str:
+    if isinstance(text, NormalizedText):
+        return text.lowered
+    return text.lower()
+
+
+def _frame_brief(frame: CulturalFrame) -> str:
+    """A frame's section of a content brief, ending in a blank line."""
+    return "\n".join([
+        f"--- {frame.name} ---",
+        "Key messages:",
+        *(f"  - {msg}" for msg in frame.key_messages[:3]),
+        "DO NOT:",
+        *(f"  - {dont}" for dont in frame.do_not_use[:3]),
+        "",
+    ])
+
+
+# Content brief sections never change, so they are formatted once
+_FRAME_BRIEFS = MappingProxyType({name: _frame_brief(frame) for name, frame in FRAMES.items()})
+
+_UNIVERSAL_GUIDELINES = "\n".join([
+    "UNIVERSAL GUIDELINES:",
+    "- Use accessible Hindustani (see hindi_translator.py glossary)",
+    "- Include specific data/citations",
+    "- End with a clear call to action",
+    "- Do not shame individuals for food choices",
+    "- Center compassion, not superiority",
+    "- Always provide alternatives, not just criticism",
+])
+
+
+@lru_cache(maxsize=512)
+def _recommend_frames(topic_lower: str, audience_lower: str) -> tuple[str, ...]:
+    """Frame names for a lowercased topic and audience; cached per pair."""
+    recommendations = []
+
+    if _DAIRY_TOPIC_RE.search(topic_lower):
+        recommendations.extend(["health_adulteration", "water_crisis", "economics"])
+        if "farmer" in audience_lower or "rural" in audience_lower:
+            recommendations.append("economics")
+        if "health" in audience_lower or "parent" in audience_lower:
+            recommendations.append("health_adulteration")
+
+    if _POULTRY_TOPIC_RE.search(topic_lower):
+        recommendations.extend(["economics", "health_adulteration"])
+
+    if _WORKER_TOPIC_RE.search(topic_lower):
+        recommendations.append("dalit_bahujan_solidarity")
+
+    if _ENVIRONMENT_TOPIC_RE.search(topic_lower):
+        recommendations.append("water_crisis")
+
+    if _TRADITION_TOPIC_RE.search(topic_lower):
+        recommendations.append("ahimsa")
+
+    # Always include ahimsa as a base frame if nothing else matches
+    if not recommendations:
+        return ("ahimsa", "health_adulteration")
+
+    # Remove duplicates while preserving order
+    return tuple(dict.fromkeys(recommendations))
 
 
 class CulturalFramer:
@@ -252,55 +405,19 @@ class CulturalFramer:
         """Get a specific cultural frame."""
         return self.frames.get(frame_name)
 
-    def list_frames(self) -> list[str]:
+    def list_frames(self) -> tuple[str, ...]:
         """List available frames."""
-        return list(self.frames.keys())
+        return FRAME_NAMES
 
-    def get_do_not_use_guidelines(self) -> dict:
+    def get_do_not_use_guidelines(self) -> Mapping[str, tuple[str, ...]]:
         """Get all 'do not use' guidelines across frames."""
-        guidelines = {}
-        for name, frame in self.frames.items():
-            guidelines[name] = frame.do_not_use
-        return guidelines
+        return DO_NOT_USE_GUIDELINES
 
-    def recommend_frames(self, topic: str, audience: str) -> list[str]:
+    def recommend_frames(
+        self, topic: Union[str, NormalizedText], audience: Union[str, NormalizedText]
+    ) -> tuple[str, ...]:
         """Recommend appropriate frames for a topic and audience."""
-        recommendations = []
-        topic_lower = topic.lower()
-        audience_lower = audience.lower()
-
-        if any(w in topic_lower for w in ["dairy", "milk", "cow", "buffalo", "amul"]):
-            recommendations.extend(["health_adulteration", "water_crisis", "economics"])
-            if "farmer" in audience_lower or "rural" in audience_lower:
-                recommendations.append("economics")
-            if "health" in audience_lower or "parent" in audience_lower:
-                recommendations.append("health_adulteration")
-
-        if any(w in topic_lower for w in ["poultry", "chicken", "egg", "factory"]):
-            recommendations.extend(["economics", "health_adulteration"])
-
-        if any(w in topic_lower for w in ["slaughter", "meat", "worker"]):
-            recommendations.append("dalit_bahujan_solidarity")
-
-        if any(w in topic_lower for w in ["water", "pollution", "environment"]):
-            recommendations.append("water_crisis")
-
-        if any(w in topic_lower for w in ["tradition", "culture", "values"]):
-            recommendations.append("ahimsa")
-
-        # Always include ahimsa as a base frame if nothing else matches
-        if not recommendations:
-            recommendations = ["ahimsa", "health_adulteration"]
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique = []
-        for r in recommendations:
-            if r not in seen:
-                seen.add(r)
-                unique.append(r)
-
-        return unique
+        return _recommend_frames(_lowered(topic), _lowered(audience))
 
     def generate_content_brief(
         self,
@@ -314,72 +431,33 @@ class CulturalFramer:
             frames = self.recommend_frames(topic, audience)
 
         brief = [
-            f"CONTENT BRIEF",
-            f"=" * 50,
+            "CONTENT BRIEF",
+            "=" * 50,
             f"Topic: {topic}",
             f"Audience: {audience}",
             f"Platform: {platform}",
             f"Recommended Frames: {', '.join(frames)}",
             "",
         ]
-
-        for frame_name in frames:
-            frame = self.frames.get(frame_name)
-            if frame:
-                brief.extend([
-                    f"--- {frame.name} ---",
-                    f"Key messages:",
-                ])
-                for msg in frame.key_messages[:3]:
-                    brief.append(f"  - {msg}")
-                brief.append("DO NOT:")
-                for dont in frame.do_not_use[:3]:
-                    brief.append(f"  - {dont}")
-                brief.append("")
-
-        brief.extend([
-            "UNIVERSAL GUIDELINES:",
-            "- Use accessible Hindustani (see hindi_translator.py glossary)",
-            "- Include specific data/citations",
-            "- End with a clear call to action",
-            "- Do not shame individuals for food choices",
-            "- Center compassion, not superiority",
-            "- Always provide alternatives, not just criticism",
-        ])
+        brief.extend(_FRAME_BRIEFS[name] for name in frames if name in _FRAME_BRIEFS)
+        brief.append(_UNIVERSAL_GUIDELINES)
 
         return "\n".join(brief)
 
-    def caste_sensitivity_check(self, content: str) -> list[str]:
+    def caste_sensitivity_check(self, content: Union[str, NormalizedText]) -> list[str]:
         """
         Check content for potentially casteist framing.
 
         Returns list of warnings. NOT a replacement for review by
         Dalit-Bahujan advocates — always seek that review.
         """
-        warnings = []
-        content_lower = content.lower()
-
-        problematic_terms = {
-            "gau mata": "Avoid 'gau mata' — entangled with Hindutva cow vigilantism",
-            "gau raksha": "Avoid 'gau raksha' — associated with violence against Dalits and Muslims",
-            "pure vegetarian": "Avoid 'pure vegetarian' — implies impurity of meat-eaters (casteist)",
-            "shuddh shakahari": "Avoid 'shuddh shakahari' — purity language is casteist",
-            "satvik": "Caution with 'satvik' — can reinforce caste hierarchy through food",
-            "tamsik": "Avoid 'tamsik' — designating foods as 'impure' reinforces caste hierarchy",
-            "rajsik": "Caution with Ayurvedic food classification — often maps to caste hierarchy",
-            "beef ban": "Handle carefully — beef bans have been weaponized against Dalits and Muslims",
-            "cow slaughter": "Handle carefully — cow protection movement has caused lynchings",
-            "vegan nation": "Avoid nationalist framing of veganism — exclusionary",
-            "ancient wisdom": "Caution — 'ancient Indian wisdom' rhetoric often means upper-caste Brahminical texts",
-        }
-
-        for term, warning in problematic_terms.items():
-            if term in content_lower:
-                warnings.append(warning)
+        content_lower = _lowered(content)
+        found = _find_terms(content_lower, _PROBLEMATIC_TERMS_RE, _PROBLEMATIC_SUBTERMS)
+        warnings = [w for term, w in _PROBLEMATIC_TERM_PAIRS if term in found]
 
         # Check for absence of worker solidarity
-        if any(w in content_lower for w in ["slaughter", "meat plant", "processing"]):
-            if not any(w in content_lower for w in ["worker", "labour", "labor", "mazdoor"]):
+        if _MEAT_PROCESSING_RE.search(content_lower):
+            if not _WORKER_RE.search(content_lower):
                 warnings.append(
                     "Content about slaughterhouses/meat processing should include "
                     "worker welfare perspective — omitting it risks framing that "
@@ -23,11 +23,13 @@ that reaches the widest possible audience. Key principles:
    Northeast) prefer English or regional languages.
 """
 
+import re
 from dataclasses import dataclass
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslatedContent:
     """Bilingual content piece."""
     english: str
@@ -39,7 +41,7 @@ class TranslatedContent:
 
 
 # Common advocacy terms — accessible Hindustani equivalents
-GLOSSARY = {
+GLOSSARY = MappingProxyType({
     # Use the Hindustani/common word, not the Sanskrit-derived one
     "water": ("paani", "पानी"),  # NOT "jal" (जल)
     "milk": ("doodh", "दूध"),  # NOT "dugdh"
@@ -72,10 +74,10 @@ GLOSSARY = {
     "cancer": ("cancer", "कैंसर"),  # Retain English — understood universally
     "environment": ("maahol/vaatavaran", "माहौल/वातावरण"),
     "poison": ("zahar", "ज़हर"),  # NOT "vish"
-}
+})
 
 # Common WhatsApp formatting
-WHATSAPP_FORMAT = {
+WHATSAPP_FORMAT = MappingProxyType({
     "max_words": 300,
     "max_chars": 1500,
     "line_break": "\n",
@@ -84,7 +86,155 @@ WHATSAPP_FORMAT = {
     "emphasis_end": "*",
     "italic_start": "_",
     "italic_end": "_",
+})
+
+# Post length limits per social media platform, in characters
+PLATFORM_CHAR_LIMITS = MappingProxyType({
+    "twitter": 280,
+    "instagram": 2200,
+    "facebook": 63206,
+})
+
+# Devanagari to Roman script, in the informal spelling used on WhatsApp
+# (paani, doodh, kisaan) rather than a scholarly transliteration scheme
+_DEVANAGARI_TO_ROMAN = str.maketrans({
+    # Consonants
+    "क": "k", "ख": "kh", "ग": "g", "घ": "gh", "ङ": "ng",
+    "च": "ch", "छ": "chh", "ज": "j", "झ": "jh", "ञ": "ny",
+    "ट": "t", "ठ": "th", "ड": "d", "ढ": "dh", "ण": "n",
+    "त": "t", "थ": "th", "द": "d", "ध": "dh", "न": "n",
+    "प": "p", "फ": "ph", "ब": "b", "भ": "bh", "म": "m",
+    "य": "y", "र": "r", "ल": "l", "व": "v",
+    "श": "sh", "ष": "sh", "स": "s", "ह": "h",
+    # Precomposed nukta consonants (qa, khha, ghha, za, dddha, rha, fa, yya)
+    "\u0958": "q", "\u0959": "kh", "\u095a": "gh", "\u095b": "z",
+    "\u095c": "r", "\u095d": "rh", "\u095e": "f", "\u095f": "y",
+    # Independent vowels
+    "अ": "a", "आ": "aa", "इ": "i", "ई": "i", "उ": "u", "ऊ": "oo", "ऋ": "ri",
+    "ए": "e", "ऐ": "ai", "ऑ": "o", "ओ": "o", "औ": "au",
+    # Vowel signs, which replace a consonant's inherent "a"
+    "ा": "aa", "ि": "i", "ी": "i", "ु": "u", "ू": "oo", "ृ": "ri",
+    "ॅ": "e", "े": "e", "ै": "ai", "ॉ": "o", "ो": "o", "ौ": "au",
+    # Nasalisation, visarga, virama (which drops the inherent "a"), danda
+    "ँ": "n", "ं": "n", "ः": "h", "्": "", "।": ".", "॥": ".",
+    **{chr(0x0966 + i): str(i) for i in range(10)},
+})
+
+# Consonant + combining nukta, folded to the precomposed letters above
+_NUKTA_FORMS = {
+    "क": "\u0958", "ख": "\u0959", "ग": "\u095a", "ज": "\u095b",
+    "ड": "\u095c", "ढ": "\u095d", "फ": "\u095e", "य": "\u095f",
 }
+_NUKTA_RE = re.compile(f"([{''.join(_NUKTA_FORMS)}])\u093c")
+
+# A consonant keeps its inherent "a" when another letter or a nasal sign
+# follows; at the end of a word it is silent (sarakaar, not sarakaara)
+_INHERENT_A_RE = re.compile(
+    "([\u0915-\u0939\u0958-\u095f])(?=[\u0901-\u0903\u0905-\u0939\u0958-\u095f])"
+)
+
+
+def romanize(text: str) -> str:
+    """
+    Write Hindi in Roman script, e.g. "किसान" -> "kisaan".
+
+    Only the word-final inherent vowel is dropped, so longer words may keep
+    vowels a native writer would omit ("जानवर" -> "jaanavar"). Text that is
+    not Devanagari passes through unchanged.
+    """
+    if "\u093c" in text:
+        text = _NUKTA_RE.sub(lambda m: _NUKTA_FORMS[m.group(1)], text)
+    return _INHERENT_A_RE.sub(r"\1a", text).translate(_DEVANAGARI_TO_ROMAN)
+
+
+# Pre-built WhatsApp messages
+DAIRY_FACTS_HINDI = (
+    "*दूध की सचाई जो आपको कोई नहीं बताता* 🐄\n"
+    "\n"
+    "1️⃣ भारत में हर साल 4 करोड़ से ज़्यादा बछड़े पैदा होते हैं। "
+    "नर बछड़ों को दूध नहीं दे सकते, इसलिए उन्हें छोड़ दिया जाता है या "
+    "कसाई को बेच दिया जाता है।\n"
+    "\n"
+    "2️⃣ गाय और भैंस को बार-बार गर्भवती किया जाता है ताकि दूध मिलता रहे। "
+    "जब दूध कम हो जाता है, तो उन्हें भी बेच दिया जाता है।\n"
+    "\n"
+    "3️⃣ FSSAI की जाँच में दूध में मिलावट पाई गई है — "
+    "यूरिया, डिटर्जेंट, स्टार्च, और पानी। ये आपकी सेहत के लिए "
+    "ख़तरनाक है।\n"
+    "\n"
+    "4️⃣ एक लीटर दूध बनाने में 1000 लीटर से ज़्यादा पानी लगता है। "
+    "जब हमारे गाँवों में पीने का पानी नहीं है, तो क्या ये सही है?\n"
+    "\n"
+    "5️⃣ Dairy industry में antibiotics का भारी इस्तेमाल होता है। "
+    "ये दूध के ज़रिए आपके शरीर में आते हैं और antibiotic resistance "
+    "बढ़ाते हैं।\n"
+    "\n"
+    "*सोचिए। जानिए। बदलिए।* 🌱\n"
+    "\n"
+    "आगे भेजें ➡️"
+)
+
+WATER_CRISIS_HINDI = (
+    "*पानी का संकट और dairy industry का कनेक्शन* 💧\n"
+    "\n"
+    "भारत दुनिया का सबसे बड़ा दूध उत्पादक है — 23 करोड़ टन/साल।\n"
+    "\n"
+    "लेकिन इसकी क़ीमत:\n"
+    "\n"
+    "💧 1 लीटर दूध = 1000+ लीटर पानी\n"
+    "(चारा उगाने, जानवरों को पिलाने, सफ़ाई, processing)\n"
+    "\n"
+    "💧 भारत के 23 करोड़ टन दूध के लिए सालाना ~230 अरब लीटर पानी चाहिए\n"
+    "\n"
+    "💧 NITI Aayog की रिपोर्ट: 2030 तक भारत में पानी की माँग "
+    "उपलब्धता से दोगुनी हो जाएगी\n"
+    "\n"
+    "💧 21 बड़े शहरों का groundwater 2025-2030 तक ख़त्म होने की आशंका\n"
+    "\n"
+    "💧 Dairy farming वाले इलाक़ों (बनासकांठा, आणंद, नामक्कल) में "
+    "groundwater level तेज़ी से गिर रहा है\n"
+    "\n"
+    "हम पानी की बर्बादी को रोक सकते हैं:\n"
+    "🌱 Plant-based दूध (सोया, बादाम, नारियल) में 80% कम पानी लगता है\n"
+    "🌱 दालों और सब्ज़ियों से protein मिलता है, बिना पानी बर्बाद किए\n"
+    "\n"
+    "*पानी बचाएँ। भविष्य बचाएँ।* 🌍\n"
+    "\n"
+    "आगे भेजें ➡️"
+)
+
+LANGUAGE_GUIDE = (
+    "LANGUAGE GUIDE: Writing Accessible Hindi for Animal Advocacy\n"
+    + "=" * 60 + "\n\n"
+    "1. USE HINDUSTANI, NOT SANSKRITIZED HINDI\n"
+    "   - paani, not jal\n"
+    "   - doodh, not dugdh\n"
+    "   - janwar, not pashu (except in legal contexts)\n"
+    "   - dawai, not aushadhi\n"
+    "   - sehat, not swasthya (casual register)\n"
+    "   - zulm/berahmi, not kroorta (casual register)\n"
+    "   - haq, not adhikar (both acceptable)\n"
+    "   - sarkaar, not shaasan\n"
+    "   - qaanoon, not vidhi\n\n"
+    "2. RETAIN ENGLISH FOR TECHNICAL TERMS\n"
+    "   - antibiotic, hormone, cancer, pollution, factory farm\n"
+    "   - These are understood across language boundaries\n\n"
+    "3. SHORT SENTENCES\n"
+    "   - Max 15-20 words per sentence\n"
+    "   - One idea per paragraph\n"
+    "   - Use numbered lists\n\n"
+    "4. AVOID\n"
+    "   - Religious framing (no 'gau mata' rhetoric — see CULTURAL_SENSITIVITY.md)\n"
+    "   - Caste-based food shaming\n"
+    "   - Assumptions about diet\n"
+    "   - Dense academic language\n\n"
+    "5. WHATSAPP SPECIFICS\n"
+    "   - Max 300 words per message\n"
+    "   - Use *bold* for emphasis\n"
+    "   - Use emoji as visual anchors (sparingly)\n"
+    "   - End with 'Forward kijiye' / 'आगे भेजें'\n"
+    "   - No attachments — text only for maximum reach\n"
+)
 
 
 class HindiTranslator:
@@ -101,7 +251,10 @@ class HindiTranslator:
 
     def get_term(self, english_term: str) -> tuple[str, str]:
         """Get Hindi equivalent (roman, devanagari) for an English term."""
-        term = self.glossary.get(english_term.lower())
+        # Glossary keys are lowercase, so most lookups hit before lower()
+        term = self.glossary.get(english_term)
+        if term is None:
+            term = self.glossary.get(english_term.lower())
         if term:
             return term
         return (english_term, english_term)  # Return as-is if not in glossary
@@ -122,7 +275,7 @@ class HindiTranslator:
         hindi_formatted = self._format_for_whatsapp(hindi_text)
 
         # Build romanized version
-        hindi_roman = ""  # Would need transliteration engine
+        hindi_roman = romanize(hindi_formatted)
 
         english = english_text or ""
 
@@ -147,13 +300,7 @@ class HindiTranslator:
         platform: str = "twitter",  # "twitter", "instagram", "facebook"
     ) -> TranslatedContent:
         """Create a social media post with bilingual content."""
-        max_chars = {
-            "twitter": 280,
-            "instagram": 2200,
-            "facebook": 63206,
-        }
-
-        limit = max_chars.get(platform, 2200)
+        limit = PLATFORM_CHAR_LIMITS.get(platform, 2200)
 
         # Combine for platform
         combined_hindi = hindi_text[:limit]
@@ -161,7 +308,7 @@ class HindiTranslator:
         return TranslatedContent(
             english=english_text,
             hindi_devanagari=combined_hindi,
-            hindi_roman="",
+            hindi_roman=romanize(combined_hindi),
             format_type=f"social_media_{platform}",
             word_count_hindi=len(hindi_text.split()),
             character_count=len(combined_hindi),
@@ -169,111 +316,21 @@ class HindiTranslator:
 
     def dairy_facts_hindi(self) -> str:
         """Pre-built: Dairy industry facts in Hindi (accessible Hindustani)."""
-        return (
-            "*दूध की सचाई जो आपको कोई नहीं बताता* 🐄\n"
-            "\n"
-            "1️⃣ भारत में हर साल 4 करोड़ से ज़्यादा बछड़े पैदा होते हैं। "
-            "नर बछड़ों को दूध नहीं दे सकते, इसलिए उन्हें छोड़ दिया जाता है या "
-            "कसाई को बेच दिया जाता है।\n"
-            "\n"
-            "2️⃣ गाय और भैंस को बार-बार गर्भवती किया जाता है ताकि दूध मिलता रहे। "
-            "जब दूध कम हो जाता है, तो उन्हें भी बेच दिया जाता है।\n"
-            "\n"
-            "3️⃣ FSSAI की जाँच में दूध में मिलावट पाई गई है — "
-            "यूरिया, डिटर्जेंट, स्टार्च, और पानी। ये आपकी सेहत के लिए "
-            "ख़तरनाक है।\n"
-            "\n"
-            "4️⃣ एक लीटर दूध बनाने में 1000 लीटर से ज़्यादा पानी लगता है। "
-            "जब हमारे गाँवों में पीने का पानी नहीं है, तो क्या ये सही है?\n"
-            "\n"
-            "5️⃣ Dairy industry में antibiotics का भारी इस्तेमाल होता है। "
-            "ये दूध के ज़रिए आपके शरीर में आते हैं और antibiotic resistance "
-            "बढ़ाते हैं।\n"
-            "\n"
-            "*सोचिए। जानिए। बदलिए।* 🌱\n"
-            "\n"
-            "आगे भेजें ➡️"
-        )
+        return DAIRY_FACTS_HINDI
 
     def water_crisis_hindi(self) -> str:
         """Pre-built: Water crisis and dairy connection in Hindi."""
-        return (
-            "*पानी का संकट और dairy industry का कनेक्शन* 💧\n"
-            "\n"
-            "भारत दुनिया का सबसे बड़ा दूध उत्पादक है — 23 करोड़ टन/साल।\n"
-            "\n"
-            "लेकिन इसकी क़ीमत:\n"
-            "\n"
-            "💧 1 लीटर दूध = 1000+ लीटर पानी\n"
-            "(चारा उगाने, जानवरों को पिलाने, सफ़ाई, processing)\n"
-            "\n"
-            "💧 भारत के 23 करोड़ टन दूध के लिए सालाना ~230 अरब लीटर पानी चाहिए\n"
-            "\n"
-            "💧 NITI Aayog की रिपोर्ट: 2030 तक भारत में पानी की माँग "
-            "उपलब्धता से दोगुनी हो जाएगी\n"
-            "\n"
-            "💧 21 बड़े शहरों का groundwater 2025-2030 तक ख़त्म होने की आशंका\n"
-            "\n"
-            "💧 Dairy farming वाले इलाक़ों (बनासकांठा, आणंद, नामक्कल) में "
-            "groundwater level तेज़ी से गिर रहा है\n"
-            "\n"
-            "हम पानी की बर्बादी को रोक सकते हैं:\n"
-            "🌱 Plant-based दूध (सोया, बादाम, नारियल) में 80% कम पानी लगता है\n"
-            "🌱 दालों और सब्ज़ियों से protein मिलता है, बिना पानी बर्बाद किए\n"
-            "\n"
-            "*पानी बचाएँ। भविष्य बचाएँ।* 🌍\n"
-            "\n"
-            "आगे भेजें ➡️"
-        )
+        return WATER_CRISIS_HINDI
 
     def _format_for_whatsapp(self, text: str) -> str:
         """Format text for WhatsApp readability."""
-        # Ensure paragraphs are separated
-        lines = text.split("\n")
-        formatted = []
-        for line in lines:
-            line = line.strip()
-            if line:
-                formatted.append(line)
-            else:
-                formatted.append("")
-        return "\n".join(formatted)
-
-    def get_glossary(self) -> dict:
+        # Trim every line, keeping blank lines as paragraph breaks
+        return "\n".join(line.strip() for line in text.split("\n"))
+
+    def get_glossary(self) -> Mapping[str, tuple[str, str]]:
         """Return the full glossary."""
         return self.glossary
 
     def language_guide(self) -> str:
         """Return guidelines for writing accessible Hindi content."""
-        return (
-            "LANGUAGE GUIDE: Writing Accessible Hindi for Animal Advocacy\n"
-            "=" * 60 + "\n\n"
-            "1. USE HINDUSTANI, NOT SANSKRITIZED HINDI\n"
-            "   - paani, not jal\n"
-            "   - doodh, not dugdh\n"
-            "   - janwar, not pashu (except in legal contexts)\n"
-            "   - dawai, not aushadhi\n"
-            "   - sehat, not swasthya (casual register)\n"
-            "   - zulm/berahmi, not kroorta (casual register)\n"
-            "   - haq, not adhikar (both acceptable)\n"
-            "   - sarkaar, not shaasan\n"
-            "   - qaanoon, not vidhi\n\n"
-            "2. RETAIN ENGLISH FOR TECHNICAL TERMS\n"
-            "   - antibiotic, hormone, cancer, pollution, factory farm\n"
-            "   - These are understood across language boundaries\n\n"
-            "3. SHORT SENTENCES\n"
-            "   - Max 15-20 words per sentence\n"
-            "   - One idea per paragraph\n"
-            "   - Use numbered lists\n\n"
-            "4. AVOID\n"
-            "   - Religious framing (no 'gau mata' rhetoric — see CULTURAL_SENSITIVITY.md)\n"
-            "   - Caste-based food shaming\n"
-            "   - Assumptions about diet\n"
-            "   - Dense academic language\n\n"
-            "5. WHATSAPP SPECIFICS\n"
-            "   - Max 300 words per message\n"
-            "   - Use *bold* for emphasis\n"
-            "   - Use emoji as visual anchors (sparingly)\n"
-            "   - End with 'Forward kijiye' / 'आगे भेजें'\n"
-            "   - No attachments — text only for maximum reach\n"
-        )
+        return LANGUAGE_GUIDE
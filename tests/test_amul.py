@@ -0,0 +1,124 @@
+"""
+Tests for the Amul research database.
+"""
+
+import json
+
+import pytest
+
+from india.amul.amul_research import RESEARCH_DATABASE, AmulResearchDB
+from india.amul.narrative_generator import NarrativeGenerator
+
+
+class TestAmulResearchDB:
+    """Test research lookups and search."""
+
+    def setup_method(self):
+        self.db = AmulResearchDB()
+
+    def test_search_single_word(self):
+        assert self.db.search("oxytocin") == ["oxytocin_use"]
+
+    def test_search_is_case_insensitive(self):
+        assert self.db.search("BANASKANTHA") == ["water_footprint"]
+
+    def test_search_matches_partial_words(self):
+        # "ground" only appears inside "groundwater"
+        assert "water_footprint" in self.db.search("ground")
+
+    def test_search_phrase(self):
+        assert self.db.search("male calves") == ["male_calf_crisis"]
+
+    def test_search_preserves_topic_order(self):
+        results = self.db.search("amul")
+        order = list(RESEARCH_DATABASE)
+        assert results == sorted(results, key=order.index)
+
+    def test_search_no_match(self):
+        assert self.db.search("zzqx") == []
+
+    def test_search_token_exact_word_only(self):
+        assert self.db.search_token("Oxytocin") == ["oxytocin_use"]
+        assert self.db.search_token("ground") == []
+
+    def test_fact_sheet(self):
+        sheet = self.db.fact_sheet()
+        assert sheet.startswith("AMUL / GCMMF FACT SHEET\n")
+        assert "Revenue (FY24): Rs. 72,000 crore" in sheet
+        assert "--- Male Calf Crisis ---" in sheet
+        assert sheet.endswith("\n")
+
+    def test_get_research_point(self):
+        point = self.db.get_research_point("oxytocin_use")
+        assert point is RESEARCH_DATABASE["oxytocin_use"]
+        assert self.db.get_research_point("unknown") is None
+
+    def test_profile_is_read_only(self):
+        profile = self.db.get_profile()
+        assert profile["founded"] == 1946
+        with pytest.raises(TypeError):
+            profile["founded"] = 2000
+
+    def test_methods_callable_on_class(self):
+        assert AmulResearchDB.search("oxytocin") == self.db.search("oxytocin")
+        assert AmulResearchDB.fact_sheet() is self.db.fact_sheet()
+
+
+class TestNarrativeGenerator:
+    """Test counter-narrative generation."""
+
+    def setup_method(self):
+        self.gen = NarrativeGenerator()
+
+    def test_generate_all_covers_every_narrative(self):
+        narratives = self.gen.generate_all("whatsapp")
+        assert len(narratives) == len(self.gen.list_narratives())
+        assert all(n.platform == "whatsapp" for n in narratives)
+
+    def test_platform_is_respected(self):
+        narrative = self.gen.missing_calves("article")
+        assert narrative.platform == "article"
+        assert narrative.angle == "male_calf_crisis"
+        assert "Rashtriya Gokul Mission" in narrative.content_english
+
+    def test_repeated_calls_reuse_narrative(self):
+        assert self.gen.water_footprint() is NarrativeGenerator().water_footprint()
+
+    def test_research_is_shared(self):
+        assert self.gen.research is NarrativeGenerator().research
+
+    def test_narrative_names_match_specs(self):
+        from india.amul._narrative_data import NARRATIVE_SPECS
+
+        assert self.gen.list_narratives() == tuple(NARRATIVE_SPECS)
+
+    def test_module_level_narrative_constant(self):
+        from india.amul import narrative_generator
+
+        narrative = narrative_generator.MISSING_CALVES_ARTICLE
+        assert narrative is self.gen.missing_calves("article")
+        with pytest.raises(AttributeError):
+            narrative_generator.NOT_A_NARRATIVE
+
+    def test_generate_all_payloads(self):
+        payloads = self.gen.generate_all_payloads("whatsapp")
+        decoded = [json.loads(p) for p in payloads]
+        assert [d["title"] for d in decoded] == [
+            n.title for n in self.gen.generate_all("whatsapp")
+        ]
+        assert decoded[1]["content_hindi"] == self.gen.missing_calves().content_hindi
+        assert self.gen.generate_all_payloads("whatsapp") is payloads
+
+    def test_spec_table_is_the_data_module_table(self):
+        from india.amul import narrative_generator
+        from india.amul._narrative_data import NARRATIVE_SPECS
+
+        assert narrative_generator._narrative_specs() is NARRATIVE_SPECS
+        assert tuple(NARRATIVE_SPECS) == narrative_generator.NARRATIVE_NAMES
+
+    def test_iter_all_matches_generate_all(self):
+        narratives = self.gen.iter_all("article")
+        assert next(narratives) is self.gen.cooperative_betrayal("article")
+        assert (self.gen.cooperative_betrayal("article"), *narratives) == (
+            self.gen.generate_all("article")
+        )
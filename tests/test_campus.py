@@ -0,0 +1,170 @@
+"""
+Tests for the campus organizing tools.
+"""
+
+import json
+from dataclasses import FrozenInstanceError, asdict
+
+import pytest
+
+from india.campus import campus_toolkit
+from india.campus.bangalore_hub import CATEGORY_CULTIVATED_MEAT, BangaloreHub
+from india.campus.campus_toolkit import CampusToolkit
+
+
+class TestBangaloreHub:
+    """Test Bangalore hub materials."""
+
+    def setup_method(self):
+        self.hub = BangaloreHub()
+
+    def test_meetup_templates_are_shared(self):
+        templates = self.hub.meetup_templates()
+        assert len(templates) == 3
+        assert templates is BangaloreHub().meetup_templates()
+
+    def test_methods_callable_on_class(self):
+        assert not hasattr(self.hub, "__dict__")
+        assert BangaloreHub.get_tech_campuses() is self.hub.get_tech_campuses()
+        assert BangaloreHub.startups_by_category(CATEGORY_CULTIVATED_MEAT)
+
+    def test_meetup_templates_are_frozen(self):
+        template = self.hub.meetup_templates()[0]
+        assert not hasattr(template, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            template.title = "Renamed"
+        assert isinstance(template.agenda, tuple)
+
+    def test_to_dict_matches_asdict(self):
+        template = self.hub.meetup_templates()[0]
+        assert template.to_dict() == asdict(template)
+        assert template.to_dict()["agenda"] is template.agenda
+        startup = self.hub.startups_by_category("Plant-based dairy")[0]
+        assert startup.to_dict() == asdict(startup)
+
+    def test_ecosystem_map_is_shared(self):
+        ecosystem = self.hub.startup_ecosystem_map()
+        assert ecosystem is BangaloreHub().startup_ecosystem_map()
+        with pytest.raises(TypeError):
+            ecosystem["relevant_vcs"] = []
+
+    def test_as_json(self):
+        data = json.loads(self.hub.as_json())
+        assert list(data) == ["alt_protein_startups", "relevant_vcs", "organizations"]
+        assert data["alt_protein_startups"][0]["name"] == "Imagine Meats"
+
+    def test_startups_by_category(self):
+        startups = self.hub.startups_by_category(CATEGORY_CULTIVATED_MEAT)
+        assert [s.name for s in startups] == ["ClearMeat", "Myoworks"]
+        assert self.hub.startups_by_category("Insect protein") == ()
+
+    def test_organizations_by_type(self):
+        ngos = self.hub.organizations_by_type("Animal welfare NGO")
+        assert [o.name for o in ngos] == [
+            "CUPA (Compassion Unlimited Plus Action)",
+            "Humane Society International / India",
+        ]
+        assert self.hub.organizations_by_type("Unknown") == ()
+
+    def test_partnerships_are_read_only(self):
+        partner = self.hub.partnership_opportunities()[0]
+        assert partner["partner"] == "Good Food Institute India"
+        with pytest.raises(TypeError):
+            partner["partner"] = "Someone else"
+
+    def test_content_calendar(self):
+        calendar = self.hub.content_calendar_template()
+        assert list(calendar) == ["month_1", "month_2", "month_3"]
+        assert calendar["month_2"]["week_1"] == "AI for Animal Welfare meetup"
+
+
+class TestCampusToolkit:
+    """Test campus advocacy materials."""
+
+    def setup_method(self):
+        self.toolkit = CampusToolkit()
+
+    def test_workshop_is_shared_and_read_only(self):
+        workshop = self.toolkit.ai_ethics_workshop()
+        assert workshop is CampusToolkit().ai_ethics_workshop()
+        assert workshop["session_1"]["title"] == "Machine Sentience and Animal Sentience"
+        with pytest.raises(TypeError):
+            workshop["session_1"]["title"] = "Changed"
+
+    def test_hackathon_problems_are_shared_and_frozen(self):
+        problems = self.toolkit.hackathon_problems()
+        assert problems is CampusToolkit().hackathon_problems()
+        assert [p.difficulty for p in problems] == [
+            "advanced", "intermediate", "beginner", "advanced",
+        ]
+        with pytest.raises(FrozenInstanceError):
+            problems[0].difficulty = "beginner"
+        assert isinstance(problems[0].data_sources, tuple)
+        assert len(set(problems)) == len(problems)
+
+    def test_to_dict_matches_asdict(self):
+        problem = self.toolkit.hackathon_problems()[0]
+        assert problem.to_dict() == asdict(problem)
+        constitution = self.toolkit.club_constitution()
+        assert constitution.to_dict() == asdict(constitution)
+        proposal = self.toolkit.csr_proposal_template("Acme")
+        assert proposal.to_dict() == asdict(proposal)
+
+    def test_hackathon_problems_table(self):
+        table = self.toolkit.hackathon_problems_table()
+        problems = self.toolkit.hackathon_problems()
+        assert len(table) == len(problems)
+        assert table[2] == (
+            problems[2].title, "beginner", problems[2].impact_metric, problems[2].description,
+        )
+
+    def test_json_payloads(self):
+        problems = json.loads(self.toolkit.hackathon_problems_json())
+        assert problems == [
+            json.loads(json.dumps(p.to_dict())) for p in self.toolkit.hackathon_problems()
+        ]
+        workshop = json.loads(self.toolkit.ai_ethics_workshop_json())
+        assert workshop["session_2"]["hands_on"].startswith("RTI Generator demo")
+        assert self.toolkit.hackathon_problems_json() is CampusToolkit().hackathon_problems_json()
+
+    def test_hackathon_problem_hash_uses_identifying_fields(self):
+        problem = self.toolkit.hackathon_problems()[0]
+        assert hash(problem) == hash((problem.title, problem.impact_metric, problem.difficulty))
+        assert problem in set(self.toolkit.hackathon_problems())
+
+    def test_club_constitution_is_shared(self):
+        constitution = self.toolkit.club_constitution()
+        assert constitution is CampusToolkit().club_constitution()
+        assert "Ahimsa Tech Collective" in constitution.name_suggestions
+
+    def test_csr_proposal_fills_company_name(self):
+        proposal = self.toolkit.csr_proposal_template("Infosys", "tech_for_good")
+        assert proposal.title.startswith("Proposal to Infosys: Open-Source")
+        assert "We propose that Infosys sponsor" in proposal.executive_summary
+        braces = self.toolkit.csr_proposal_template("{Acme}")
+        assert braces.title.startswith("Proposal to {Acme}:")
+
+    def test_csr_proposal_is_frozen(self):
+        proposal = self.toolkit.csr_proposal_template("Acme")
+        assert not hasattr(proposal, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            proposal.title = "Changed"
+
+    def test_csr_proposal_unknown_focus_falls_back(self):
+        assert self.toolkit.csr_proposal_template("Acme", "unknown") == (
+            self.toolkit.csr_proposal_template("Acme", "food_safety")
+        )
+
+    def test_module_functions_back_the_class(self):
+        assert campus_toolkit.hackathon_problems() is self.toolkit.hackathon_problems()
+        assert campus_toolkit.csr_proposal_template("Acme") == (
+            CampusToolkit.csr_proposal_template("Acme")
+        )
+        assert not hasattr(self.toolkit, "__dict__")
+
+    def test_talking_points(self):
+        points = self.toolkit.talking_points_for_campus_meetings()
+        assert set(points) == {
+            "mess_committee", "research_ethics_board", "sustainability_cell", "placement_cell",
+        }
+        assert all(isinstance(v, tuple) and v for v in points.values())
@@ -0,0 +1,77 @@
+"""
+Tests for the command line interface.
+"""
+
+import json
+import subprocess
+import sys
+
+from click.testing import CliRunner
+
+from india.cli import LazyGroup, cli
+
+
+class TestCli:
+    """Test command dispatch and output."""
+
+    def setup_method(self):
+        self.runner = CliRunner()
+
+    def test_lists_every_group(self):
+        result = self.runner.invoke(cli, ["--help"])
+        assert result.exit_code == 0
+        for name in LazyGroup.lazy_subcommands:
+            assert f"  {name} " in result.output
+
+    def test_unknown_group(self):
+        result = self.runner.invoke(cli, ["nope"])
+        assert result.exit_code == 2
+        assert "No such command 'nope'" in result.output
+
+    def test_only_named_group_is_imported(self):
+        code = (
+            "import sys\n"
+            "from india.cli import cli\n"
+            "cli(['rti', 'agencies'], standalone_mode=False)\n"
+            "print(sorted(m for m in sys.modules if m.startswith('india.cli_')))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.splitlines()[-1] == "['india.cli_rti']"
+
+    def test_json_output_keeps_unicode(self):
+        result = self.runner.invoke(cli, ["map", "operators", "--detail", "gcmmf_amul"])
+        assert result.exit_code == 0
+        assert "\\u2014" not in result.output
+        assert json.loads(result.output)["headquarters"] == "Anand, Gujarat"
+
+    def test_ecosystem_serializes_profiles(self):
+        result = self.runner.invoke(cli, ["campus", "bangalore", "--ecosystem"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["alt_protein_startups"][0]["name"] == "Imagine Meats"
+
+    def test_hackathon_listing(self):
+        result = self.runner.invoke(cli, ["campus", "hackathon"])
+        assert result.exit_code == 0
+        assert result.output.count("=" * 60) == 4
+        assert result.output.endswith("\n")
+
+    def test_narrative_type_must_be_a_narrative(self):
+        result = self.runner.invoke(cli, ["amul", "narrative", "--type", "research"])
+        assert result.exit_code == 0
+        assert result.output.startswith("Unknown narrative type: research\n")
+
+    def test_unknown_agency(self):
+        result = self.runner.invoke(
+            cli, ["rti", "generate", "--agency", "nope", "--name", "A", "--address", "B"]
+        )
+        assert result.exit_code == 1
+        assert "Available: awbi, " in result.output
+
+    def test_pil_citations(self):
+        result = self.runner.invoke(cli, ["pil", "research", "--citations", "transport"])
+        assert result.exit_code == 0
+        assert "    - Article 21: " in result.output
+        assert "Gauri Maulekhi" in result.output
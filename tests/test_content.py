@@ -0,0 +1,187 @@
+"""
+Tests for the content and cultural framing tools.
+"""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from india.content.cultural_framing import (
+    FRAMES,
+    PROBLEMATIC_TERMS,
+    CulturalFramer,
+    _contained_terms,
+    _find_terms,
+    _term_pattern,
+    normalize,
+)
+from india.content.hindi_translator import GLOSSARY, HindiTranslator, romanize
+
+
+class TestCulturalFramer:
+    """Test frame lookups and recommendations."""
+
+    def setup_method(self):
+        self.framer = CulturalFramer()
+
+    def test_frames_have_no_instance_dict(self):
+        frame = self.framer.get_frame("ahimsa")
+        assert frame.name == "Ahimsa (Non-violence)"
+        assert not hasattr(frame, "__dict__")
+
+    def test_frames_are_read_only(self):
+        frame = self.framer.get_frame("water_crisis")
+        assert isinstance(frame.do_not_use, tuple)
+        with pytest.raises(FrozenInstanceError):
+            frame.name = "Renamed"
+        with pytest.raises(TypeError):
+            FRAMES["new"] = frame
+
+    def test_list_frames_is_shared(self):
+        names = self.framer.list_frames()
+        assert names[0] == "ahimsa"
+        assert names is CulturalFramer().list_frames()
+
+    def test_do_not_use_guidelines(self):
+        guidelines = self.framer.get_do_not_use_guidelines()
+        assert tuple(guidelines) == self.framer.list_frames()
+        assert guidelines["ahimsa"] is FRAMES["ahimsa"].do_not_use
+        assert guidelines is CulturalFramer().get_do_not_use_guidelines()
+
+    def test_recommend_frames(self):
+        frames = self.framer.recommend_frames("Amul milk", "Rural farmers")
+        assert frames == ("health_adulteration", "water_crisis", "economics")
+        assert frames is CulturalFramer().recommend_frames("AMUL MILK", "rural farmers")
+
+    def test_recommend_frames_matches_plurals(self):
+        assert self.framer.recommend_frames("Cows and eggs", "") == (
+            "health_adulteration", "water_crisis", "economics",
+        )
+
+    def test_content_brief(self):
+        brief = self.framer.generate_content_brief(
+            "Water", "Students", frames=["water_crisis", "nope"]
+        )
+        assert brief.startswith("CONTENT BRIEF\n" + "=" * 50 + "\nTopic: Water\n")
+        assert "Recommended Frames: water_crisis, nope\n\n--- " in brief
+        assert brief.count("DO NOT:") == 1
+        assert "  - Overstating claims without data\n\nUNIVERSAL GUIDELINES:\n" in brief
+        assert brief.endswith("\n- Always provide alternatives, not just criticism")
+
+    def test_recommend_frames_default(self):
+        assert self.framer.recommend_frames("Festivals", "Students") == (
+            "ahimsa", "health_adulteration",
+        )
+
+
+class TestCasteSensitivityCheck:
+    """Test the caste sensitivity check."""
+
+    def setup_method(self):
+        self.framer = CulturalFramer()
+
+    def test_warnings_follow_term_order(self):
+        warnings = self.framer.caste_sensitivity_check("Ancient wisdom says GAU MATA")
+        assert warnings == [PROBLEMATIC_TERMS["gau mata"], PROBLEMATIC_TERMS["ancient wisdom"]]
+
+    def test_repeated_term_warns_once(self):
+        warnings = self.framer.caste_sensitivity_check("satvik food, satvik living")
+        assert warnings == [PROBLEMATIC_TERMS["satvik"]]
+
+    def test_overlapping_terms_are_all_found(self):
+        warnings = self.framer.caste_sensitivity_check("gau matancient wisdom")
+        assert warnings == [PROBLEMATIC_TERMS["gau mata"], PROBLEMATIC_TERMS["ancient wisdom"]]
+
+    def test_terms_sharing_a_prefix_are_all_found(self):
+        terms = ("beef", "beef ban ruling", "beef ban", "ban")
+        assert _term_pattern(terms).match("beef ban ruling").group(1) == "beef ban ruling"
+        found = _find_terms("a beef ban ruling", _term_pattern(terms), _contained_terms(terms))
+        assert found == set(terms)
+        assert _find_terms("beef", _term_pattern(terms), _contained_terms(terms)) == {"beef"}
+
+    def test_slaughter_without_workers(self):
+        warnings = self.framer.caste_sensitivity_check("Stop cow slaughter")
+        assert warnings[0] == PROBLEMATIC_TERMS["cow slaughter"]
+        assert warnings[1].startswith("Content about slaughterhouses")
+        assert self.framer.caste_sensitivity_check("Meat plant workers") == [
+            self.framer.caste_sensitivity_check("")[0]
+        ]
+
+    def test_worker_terms_match_inside_words(self):
+        assert self.framer.caste_sensitivity_check("Slaughterhouse labourers") == [
+            self.framer.caste_sensitivity_check("")[0]
+        ]
+
+    def test_normalized_text_is_shared(self):
+        text = normalize("Cow slaughter and Gau Mata")
+        assert text.lowered == "cow slaughter and gau mata"
+        assert self.framer.caste_sensitivity_check(text) == (
+            self.framer.caste_sensitivity_check(text.raw)
+        )
+        assert self.framer.recommend_frames(text, normalize("Parents")) == (
+            self.framer.recommend_frames(text.raw, "Parents")
+        )
+
+    def test_clean_content(self):
+        warnings = self.framer.caste_sensitivity_check("Milk needs a lot of water")
+        assert len(warnings) == 1
+        assert warnings[0].startswith("No automated issues detected.")
+
+
+class TestHindiTranslator:
+    """Test the Hindi translation helpers."""
+
+    def setup_method(self):
+        self.translator = HindiTranslator()
+
+    def test_glossary_is_read_only(self):
+        assert self.translator.get_glossary()["water"] == ("paani", "पानी")
+        with pytest.raises(TypeError):
+            GLOSSARY["water"] = ("jal", "जल")
+
+    def test_language_guide_header(self):
+        lines = self.translator.language_guide().splitlines()
+        assert lines[:3] == [
+            "LANGUAGE GUIDE: Writing Accessible Hindi for Animal Advocacy", "=" * 60, "",
+        ]
+
+    def test_whatsapp_message(self):
+        message = self.translator.create_whatsapp_message("  पानी  \n\n दूध ", "Water, milk")
+        assert not hasattr(message, "__dict__")
+        assert message.hindi_devanagari == "पानी\n\nदूध"
+        assert message.character_count == len("पानी\n\nदूध\n\n---\n\nWater, milk")
+        assert message.word_count_hindi == 2
+
+    def test_get_term(self):
+        assert self.translator.get_term("water") is GLOSSARY["water"]
+        assert self.translator.get_term("Factory Farm") is GLOSSARY["factory farm"]
+        assert self.translator.get_term("Tofu") == ("Tofu", "Tofu")
+
+    def test_romanize(self):
+        assert romanize("किसान") == "kisaan"
+        assert romanize("सरकार का क़ानून") == "sarakaar kaa qaanoon"
+        assert romanize("ज\u093cहर") == romanize("\u095bहर") == "zahar"
+        assert romanize("मुर्गी, १० अंडे।") == "murgi, 10 ande."
+        assert romanize("FSSAI 🐄") == "FSSAI 🐄"
+
+    def test_whatsapp_formatting_keeps_blank_lines(self):
+        message = self.translator.create_whatsapp_message("\n  पानी\t\r\n \n दूध  \n")
+        assert message.hindi_devanagari == "\nपानी\n\nदूध\n"
+
+    def test_whatsapp_formatting_keeps_inner_whitespace(self):
+        message = self.translator.create_whatsapp_message("पानी" + " " * 50_000 + "दूध")
+        assert message.hindi_devanagari == "पानी" + " " * 50_000 + "दूध"
+
+    def test_whatsapp_message_is_romanized(self):
+        message = self.translator.create_whatsapp_message("दूध और पानी")
+        assert message.hindi_roman == "doodh aur paani"
+
+    def test_social_media_post_truncates(self):
+        post = self.translator.create_social_media_post("क" * 300, "English", "twitter")
+        assert post.hindi_devanagari == "क" * 280
+        assert post.format_type == "social_media_twitter"
+        assert post.word_count_hindi == 1
+
+    def test_social_media_post_unknown_platform(self):
+        post = self.translator.create_social_media_post("क" * 3000, "English", "mastodon")
+        assert post.character_count == 2200
@@ -0,0 +1,104 @@
+"""
+Tests for the legal research database.
+"""
+
+import subprocess
+import sys
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from india.legal import pil_research
+from india.legal.pil_research import LegalDatabase
+
+
+class TestLegalDatabase:
+    """Test lookups and search."""
+
+    def setup_method(self):
+        self.db = LegalDatabase()
+
+    def test_instance_is_shared(self):
+        assert LegalDatabase.instance() is LegalDatabase.instance()
+        assert LegalDatabase.instance() is not self.db
+
+    def test_entries_are_frozen(self):
+        case = self.db.get_case("nagaraja_2014")
+        assert not hasattr(case, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            case.year = 2015
+        with pytest.raises(FrozenInstanceError):
+            self.db.get_statute("pca_act_1960").title = "Renamed"
+        assert isinstance(case.key_principles, tuple)
+        assert case in {case}
+
+    def test_key_listings_are_shared(self):
+        assert self.db.list_all_cases()[0] == "nagaraja_2014"
+        assert self.db.list_all_cases() is self.db.list_all_cases()
+        assert self.db.list_all_provisions() == tuple(self.db.provisions)
+        assert len(self.db.list_all_statutes()) == 6
+
+    def test_search_is_case_insensitive(self):
+        results = self.db.search("NAGARAJA")
+        assert results == self.db.search("nagaraja")
+        assert "nagaraja_2014" in results["cases"]
+
+    def test_search_does_not_span_fields(self):
+        case = self.db.get_case("nagaraja_2014")
+        assert self.db.search(case.name[-5:] + case.key_principles[0][:5])["cases"] == []
+        assert self.db.search("\0") == {"provisions": [], "statutes": [], "cases": []}
+
+    def test_search_many_keeps_prefix_queries(self):
+        queries = ["cow", "cows", "COW", "xyzzy"]
+        assert self.db.search_many(queries) == [self.db.search(q) for q in queries]
+        assert self.db.search_many([]) == []
+
+    def test_search_miss(self):
+        assert self.db.search("xyzzy") == {"provisions": [], "statutes": [], "cases": []}
+
+    def test_search_cache_is_shared_between_instances(self):
+        assert not hasattr(self.db, "_search_hits")
+        assert LegalDatabase().search("circus") == self.db.search("circus")
+
+    def test_repeated_search_returns_fresh_lists(self):
+        first = self.db.search("Transport")
+        first["statutes"].clear()
+        second = self.db.search("transport")
+        assert "transport_rules_1978" in second["statutes"]
+        assert second["statutes"] is not first["statutes"]
+
+    def test_pil_citations_match_keywords_inside_words(self):
+        citations = self.db.get_pil_citations("Vehicles leaving a slaughterhouse")
+        assert citations["statutory"] == [
+            self.db.get_statute("transport_rules_1978"),
+            self.db.get_statute("transport_rules_2001"),
+            self.db.get_statute("slaughter_house_rules_2001"),
+            self.db.get_statute("fss_act_2006"),
+        ]
+        assert citations["case_law"][-1] is self.db.get_case("nagaraja_2014")
+
+    def test_pil_citations_core_provisions(self):
+        citations = self.db.get_pil_citations("Anything")
+        assert [p.identifier for p in citations["constitutional"]] == [
+            "Article 51A(g)", "Article 21",
+        ]
+        assert citations["statutory"] == []
+
+    def test_repeated_pil_citations_return_fresh_lists(self):
+        first = self.db.get_pil_citations("Dairy")
+        first["statutory"].append(None)
+        second = self.db.get_pil_citations("dairy")
+        assert second["statutory"] == [self.db.get_statute("pca_act_1960")]
+
+    def test_tables_load_on_first_access(self):
+        code = (
+            "import sys\n"
+            "import india.legal.pil_research as m\n"
+            "print('india.legal._legal_data' in sys.modules)\n"
+            "print(len(m.LANDMARK_CASES))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.split() == ["False", "6"]
+        assert pil_research.STATUTES is self.db.statutes